@@ -1,5 +1,9 @@
 """Nox sessions for the python-package-copier."""
 
+import hashlib
+import os
+from pathlib import Path
+
 import nox
 
 # Require Nox version 2024.3.2 or newer to support the 'default_venv_backend' option
@@ -8,28 +12,61 @@ nox.needs_version = ">=2024.3.2"
 # Set 'uv' as the default backend for creating virtual environments
 nox.options.default_venv_backend = "uv|virtualenv"
 
+# Reuse existing virtualenvs across runs; _ensure_sync keeps their dependencies current
+nox.options.reuse_venv = "yes"
+
 # Default sessions to run when nox is called without arguments
 nox.options.sessions = ["fix", "test_fast", "serve_docs"]
 
 
+def _uv_env(session: nox.Session) -> dict[str, str]:
+    """Environment for ``uv sync`` into the session's virtualenv.
+
+    All sessions share one uv cache so wheels are downloaded and built once;
+    an explicit ``UV_CACHE_DIR`` (e.g. from setup-uv in CI) takes precedence.
+    """
+    return {
+        "UV_PROJECT_ENVIRONMENT": session.virtualenv.location,
+        "UV_CACHE_DIR": os.environ.get("UV_CACHE_DIR") or str(Path(session.cache_dir) / "uv-cache"),
+    }
+
+
+def _ensure_sync(session: nox.Session, *args: str) -> None:
+    """Install dependencies with ``uv sync`` unless the virtualenv is already up to date.
+
+    The sync is skipped when ``pyproject.toml``, ``uv.lock`` and the sync arguments
+    all match what was last installed into this virtualenv (e.g. with ``nox -r``).
+    """
+    digest = hashlib.blake2b("\0".join(args).encode())
+    for name in ("pyproject.toml", "uv.lock"):
+        path = Path(name)
+        if path.exists():
+            digest.update(path.read_bytes())
+    stamp = Path(session.virtualenv.location) / ".sync-hash"
+    if stamp.exists() and stamp.read_text(encoding="utf-8") == digest.hexdigest():
+        session.log("Dependencies unchanged, skipping uv sync")
+        return
+    # run_install returns None when it skips the command (--no-install on a reused
+    # virtualenv); only stamp the virtualenv when uv sync actually ran
+    if session.run_install("uv", "sync", *args, env=_uv_env(session)) is not None:
+        stamp.write_text(digest.hexdigest(), encoding="utf-8")
+
+
 @nox.session(python=["3.11", "3.12", "3.13", "3.14"], venv_backend="uv")
 def test(session: nox.Session) -> None:
     """Run the tests with pytest."""
     # Install dependencies
-    session.run_install(
-        "uv",
-        "sync",
-        "--group",
-        "tests",
-        env={"UV_PROJECT_ENVIRONMENT": session.virtualenv.location},
-    )
+    _ensure_sync(session, "--group", "tests")
 
     # Run tests with parallel execution
     session.run(
         "pytest",
         "tests/",
+        "--run-slow",
         "-n",
         "auto",
+        "--dist",
+        "loadscope",
         "-v",
         *session.posargs,
     )
@@ -39,13 +76,7 @@ def test(session: nox.Session) -> None:
 def test_fast(session: nox.Session) -> None:
     """Run fast tests (excludes slow and integration tests)."""
     # Install dependencies
-    session.run_install(
-        "uv",
-        "sync",
-        "--group",
-        "tests",
-        env={"UV_PROJECT_ENVIRONMENT": session.virtualenv.location},
-    )
+    _ensure_sync(session, "--group", "tests")
 
     # Run fast tests only with parallel execution
     session.run(
@@ -55,6 +86,8 @@ def test_fast(session: nox.Session) -> None:
         "not slow and not integration",
         "-n",
         "auto",
+        "--dist",
+        "loadscope",
         "-v",
         *session.posargs,
     )
@@ -64,13 +97,7 @@ def test_fast(session: nox.Session) -> None:
 def test_slow(session: nox.Session) -> None:
     """Run slow and integration tests."""
     # Install dependencies
-    session.run_install(
-        "uv",
-        "sync",
-        "--group",
-        "tests",
-        env={"UV_PROJECT_ENVIRONMENT": session.virtualenv.location},
-    )
+    _ensure_sync(session, "--group", "tests")
 
     # Run slow/integration tests only with parallel execution
     session.run(
@@ -78,8 +105,11 @@ def test_slow(session: nox.Session) -> None:
         "tests/",
         "-m",
         "slow or integration",
+        "--run-slow",
         "-n",
         "auto",
+        "--dist",
+        "loadscope",
         "-v",
         "-v",
         *session.posargs,
@@ -90,14 +120,7 @@ def test_slow(session: nox.Session) -> None:
 def fix(session: nox.Session) -> None:
     """Format the code base to adhere to our styles, and complain about what we cannot do automatically."""
     # Install dependencies
-    session.run_install(
-        "uv",
-        "sync",
-        "--no-default-groups",
-        "--group",
-        "fix",
-        env={"UV_PROJECT_ENVIRONMENT": session.virtualenv.location},
-    )
+    _ensure_sync(session, "--no-default-groups", "--group", "fix")
 
     # Run pre-commit
     session.run("pre-commit", "run", "--all-files", "--show-diff-on-failure", *session.posargs, external=True)
@@ -107,14 +130,7 @@ def fix(session: nox.Session) -> None:
 def lint(session: nox.Session) -> None:
     """Run linters."""
     # Install dependencies
-    session.run_install(
-        "uv",
-        "sync",
-        "--no-default-groups",
-        "--group",
-        "lint",
-        env={"UV_PROJECT_ENVIRONMENT": session.virtualenv.location},
-    )
+    _ensure_sync(session, "--no-default-groups", "--group", "lint")
 
     # Run ruff check
     session.run("ruff", "check", "tests/", external=True)
@@ -124,13 +140,7 @@ def lint(session: nox.Session) -> None:
 def build_docs(session: nox.Session) -> None:
     """Build the documentation."""
     # Install dependencies
-    session.run_install(
-        "uv",
-        "sync",
-        "--group",
-        "docs",
-        env={"UV_PROJECT_ENVIRONMENT": session.virtualenv.location},
-    )
+    _ensure_sync(session, "--group", "docs")
 
     # Build the docs
     session.run("mkdocs", "build", "--clean", external=True)
@@ -140,15 +150,8 @@ def build_docs(session: nox.Session) -> None:
 def serve_docs(session: nox.Session) -> None:
     """Run a development server for working on documentation."""
     # Install dependencies
-    session.run_install(
-        "uv",
-        "sync",
-        "--group",
-        "docs",
-        env={"UV_PROJECT_ENVIRONMENT": session.virtualenv.location},
-    )
+    _ensure_sync(session, "--group", "docs")
 
-    # Build and serve the docs
-    session.run("mkdocs", "build", "--clean", external=True)
+    # Serve the docs; mkdocs serve builds on startup and rebuilds only changed pages
     session.log("###### Starting local server. Press Control+C to stop server ######")
-    session.run("mkdocs", "serve", "-a", "localhost:8080", external=True)
+    session.run("mkdocs", "serve", "-a", "localhost:8080", "--dirty", external=True)
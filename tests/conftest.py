@@ -1,83 +1,346 @@
 """Pytest configuration for template tests."""
 
+import functools
+import hashlib
+import os
+import shutil
+import subprocess
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
 from copier import run_copy
 
 
+def pytest_addoption(parser):
+    """Register ``--run-slow`` to opt in to the slow test suite."""
+    parser.addoption("--run-slow", action="store_true", default=False, help="run tests marked as slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless ``--run-slow`` is given.
+
+    The slow tests build full documentation sites and dominate a local run, so
+    they only execute when explicitly requested (the nox sessions, just recipes
+    and CI all pass the flag).
+    """
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --run-slow option to run")
+    for item in items:
+        if SLOW_TEST_MARKER in item.keywords:
+            item.add_marker(skip_slow)
+
+
+# Default answers
+DEFAULT_ANSWERS = {
+    "project_name": "Test Project",
+    "project_slug": "test-project",
+    "package_name": "test_project",
+    "description": "A test project",
+    "author_name": "Test Author",
+    "author_email": "test@example.com",
+    "github_username": "testuser",
+    "version": "0.1.0",
+    "min_python_version": "3.11",
+    "max_python_version": "3.14",
+    "license": "MIT",
+    "include_actions": True,
+    "include_examples": True,
+}
+
+
+def _answers_with_defaults(extra_answers: dict | None) -> dict:
+    """Return the default answers overridden with extra answers."""
+    answers = dict(DEFAULT_ANSWERS)
+    if extra_answers:
+        answers.update(extra_answers)
+    return answers
+
+
+def _exclude_all_but(only: tuple[str, ...] | None) -> list[str]:
+    """Build copier exclude patterns that skip everything except the given paths."""
+    if only is None:
+        return []
+    return ["*", *(f"!{path}" for path in only), *(f"!{path}/**" for path in only)]
+
+
+class RenderCache:
+    """Session-wide cache of rendered template directories keyed by answers.
+
+    Rendering the template is by far the most expensive step of the test suite,
+    and most tests render it with identical answers. Each unique set of answers
+    is rendered once per test run into a temporary directory shared by all xdist
+    workers; tests then receive a private copy of that render.
+    """
+
+    def __init__(self, template_dir: Path, tmp_path_factory: pytest.TempPathFactory):
+        self.template_dir = template_dir
+        self.tmp_path_factory = tmp_path_factory
+        self._renders: dict[tuple[frozenset, tuple[str, ...] | None], Path] = {}
+
+        # xdist workers get subdirectories of the run's base temporary directory
+        basetemp = tmp_path_factory.getbasetemp()
+        shared_root = basetemp.parent if os.environ.get("PYTEST_XDIST_WORKER") else basetemp
+        self.shared_dir = shared_root / "tpl-renders"
+        self.shared_dir.mkdir(exist_ok=True)
+
+    def render(self, answers: dict, only: tuple[str, ...] | None = None) -> Path:
+        """Return the rendered directory for the given answers.
+
+        When ``only`` is given, just those top-level paths of the template are
+        rendered, which is enough for tests that inspect a handful of files.
+        """
+        key = (frozenset(answers.items()), only)
+        if key not in self._renders:
+            digest = hashlib.sha1(repr((sorted(answers.items()), only)).encode()).hexdigest()
+            render_dir = self.shared_dir / digest
+            if render_dir.is_dir():
+                # Already rendered by another worker
+                self._renders[key] = render_dir
+                return render_dir
+
+            staging_dir = self.tmp_path_factory.mktemp("tpl-cache") / "project"
+
+            # Run copier - use HEAD to get latest changes
+            run_copy(
+                str(self.template_dir),
+                str(staging_dir),
+                data=answers,
+                defaults=True,
+                overwrite=True,
+                unsafe=True,
+                vcs_ref="HEAD",
+                exclude=_exclude_all_but(only),
+            )
+
+            # Publish atomically; if another worker won the race, use its identical render
+            try:
+                staging_dir.rename(render_dir)
+            except OSError:
+                if not render_dir.is_dir():
+                    raise
+            self._renders[key] = render_dir
+        return self._renders[key]
+
+
 class CopierTestFixture:
     """Helper class for testing copier templates."""
 
-    def __init__(self, template_dir: Path, tmp_path: Path):
+    def __init__(self, template_dir: Path, tmp_path: Path, cache: RenderCache):
         self.template_dir = template_dir
         self.tmp_path = tmp_path
+        self.cache = cache
 
-    def copy(self, extra_answers: dict | None = None):
-        """Copy the template with given answers."""
-        project_dir = self.tmp_path / "test-project"
-
-        # Default answers
-        answers = {
-            "project_name": "Test Project",
-            "project_slug": "test-project",
-            "package_name": "test_project",
-            "description": "A test project",
-            "author_name": "Test Author",
-            "author_email": "test@example.com",
-            "github_username": "testuser",
-            "version": "0.1.0",
-            "min_python_version": "3.11",
-            "max_python_version": "3.14",
-            "license": "MIT",
-            "include_actions": True,
-            "include_examples": True,
-        }
-
-        # Override with extra answers
-        if extra_answers:
-            answers.update(extra_answers)
-
-        # Run copier - use HEAD to get latest changes
-        result = run_copy(
-            str(self.template_dir),
-            str(project_dir),
-            data=answers,
-            defaults=True,
-            overwrite=True,
-            unsafe=True,
-            vcs_ref="HEAD",
-        )
+    def copy(self, extra_answers: dict | None = None, dirname: str = "test-project"):
+        """Copy the template with given answers into ``tmp_path / dirname``."""
+        project_dir = self.tmp_path / dirname
+        answers = _answers_with_defaults(extra_answers)
+
+        # Copy the cached render so tests can freely modify their project
+        render_dir = self.cache.render(answers)
+        shutil.copytree(render_dir, project_dir, dirs_exist_ok=True)
 
-        return CopierResult(project_dir=project_dir, result=result)
+        return CopierResult(project_dir=project_dir)
 
 
 class CopierResult:
     """Result of a copier template copy operation."""
 
-    def __init__(self, project_dir: Path, result):
+    def __init__(self, project_dir: Path):
         self.project_dir = project_dir
-        self.result = result
         self.exit_code = 0 if project_dir.exists() else 1
         self.exception = None
 
 
+@dataclass(frozen=True)
+class RenderedProject:
+    """Shared read-only render together with the text of its most inspected files.
+
+    Each file is read and decoded the first time a test asks for it, so renders
+    only pay for the files their tests actually check.
+    """
+
+    project_dir: Path
+
+    def _read(self, relpath: str) -> str:
+        return (self.project_dir / relpath).read_text(encoding="utf-8")
+
+    @functools.cached_property
+    def pyproject(self) -> str:
+        """Text of ``pyproject.toml``."""
+        return self._read("pyproject.toml")
+
+    @functools.cached_property
+    def readme(self) -> str:
+        """Text of ``README.md``."""
+        return self._read("README.md")
+
+    @functools.cached_property
+    def mkdocs(self) -> str:
+        """Text of ``mkdocs.yml``."""
+        return self._read("mkdocs.yml")
+
+    @functools.cached_property
+    def docs_index(self) -> str:
+        """Text of ``docs/index.md``."""
+        return self._read("docs/index.md")
+
+    @functools.cached_property
+    def license(self) -> str:
+        """Text of ``LICENSE``."""
+        return self._read("LICENSE")
+
+
+@pytest.fixture(scope="session")
+def render_cache(tmp_path_factory):
+    """Fixture that provides the session-wide cache of template renders."""
+    template_dir = Path(__file__).parent.parent
+    return RenderCache(template_dir, tmp_path_factory)
+
+
+@pytest.fixture(scope="session")
+def cached_run_copy(render_cache):
+    """Fixture that renders the template with exactly the given answers, once per session.
+
+    Unlike ``copie_cache``, the answers are not merged with ``DEFAULT_ANSWERS``,
+    so omitted questions fall back to the template's own defaults (e.g. derived
+    names). Returns the shared, read-only project directory.
+    """
+
+    def render(answers: dict) -> Path:
+        return render_cache.render(answers)
+
+    return render
+
+
+@pytest.fixture(scope="session")
+def copie_cache(render_cache):
+    """Fixture that renders the template once per answer set and shares the result.
+
+    Unlike ``copie``, the returned project directory is shared by every test that
+    uses the same answers, so tests must treat it as read-only. Use ``copie`` for
+    tests that modify or build the generated project. Pass ``only`` to render just
+    the top-level paths a test inspects. A failed render raises copier's own error
+    in the requesting test, so tests do not need to check ``exit_code`` themselves.
+    """
+
+    def render(extra_answers: dict | None = None, only: tuple[str, ...] | None = None) -> CopierResult:
+        return CopierResult(project_dir=render_cache.render(_answers_with_defaults(extra_answers), only))
+
+    return render
+
+
+@pytest.fixture(scope="session")
+def rendered_projects(copie_cache):
+    """Fixture that provides shared read-only renders with lazily read main files.
+
+    Builds on ``copie_cache``, so each answer set is rendered once per session.
+    Each of ``pyproject.toml``, ``README.md``, ``mkdocs.yml``, ``docs/index.md`` and
+    ``LICENSE`` is read the first time a test asks for it, and at most once per answer
+    set. Tests that modify the project must use ``copie`` instead.
+    """
+
+    @functools.cache
+    def read(answers: tuple) -> RenderedProject:
+        return RenderedProject(copie_cache(dict(answers)).project_dir)
+
+    def render(extra_answers: dict | None = None) -> RenderedProject:
+        return read(tuple(sorted((extra_answers or {}).items())))
+
+    return render
+
+
+@pytest.fixture(scope="session")
+def baseline_rendered(rendered_projects):
+    """Fixture that provides the shared read-only render with the default answers."""
+    return rendered_projects({})
+
+
+@pytest.fixture(scope="session")
+def rendered_examples_on(copie_cache):
+    """Fixture that provides the shared read-only render with examples enabled."""
+    return copie_cache({"include_examples": True})
+
+
+@pytest.fixture(scope="session")
+def rendered_examples_off(copie_cache):
+    """Fixture that provides the shared read-only render with examples disabled."""
+    return copie_cache({"include_examples": False})
+
+
+@pytest.fixture(scope="session")
+def uv_cache_env(tmp_path_factory):
+    """Fixture that provides a subprocess environment sharing one warm uv cache.
+
+    Generated projects' nox sessions keep their uv cache inside ``.nox/`` unless
+    ``UV_CACHE_DIR`` is set, so every freshly rendered project would otherwise
+    download its dependencies from scratch. The shared cache is prewarmed with
+    ``uvx nox`` once per test session when ``uvx`` is available; without it the
+    tests' own ``uvx`` calls fail as usual.
+
+    Only the cache is shared: the generated noxfiles point ``UV_PROJECT_ENVIRONMENT``
+    at each session's own virtualenv, and projects rendered with different
+    answers need different environments anyway.
+
+    The builds also skip writing bytecode and colouring their output: the
+    projects are thrown away after the run, and the output only goes to logs.
+    """
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1", "NO_COLOR": "1"}
+    if "UV_CACHE_DIR" not in env:
+        uv = shutil.which("uv")
+        cache_dir = None
+        if uv is not None:
+            cache_dir = subprocess.run([uv, "cache", "dir"], capture_output=True, text=True, check=False).stdout.strip()
+        env["UV_CACHE_DIR"] = cache_dir or str(tmp_path_factory.mktemp("uv-cache"))
+
+    if shutil.which("uvx") is not None:
+        subprocess.run(
+            ["uvx", "nox", "--version"],
+            env=env,
+            capture_output=True,
+            timeout=SUBPROCESS_TIMEOUT,
+            check=False,
+        )
+    return env
+
+
 @pytest.fixture
-def copie(tmp_path):
+def copie(tmp_path, render_cache):
     """Fixture that provides a copier test helper."""
     template_dir = Path(__file__).parent.parent
-    return CopierTestFixture(template_dir, tmp_path)
+    return CopierTestFixture(template_dir, tmp_path, cache=render_cache)
+
+
+@pytest.fixture(scope="module")
+def copie_module(tmp_path_factory, render_cache):
+    """Fixture that provides a copier test helper whose projects last for a whole module.
+
+    Useful for module-scoped fixtures that share one writable project between tests.
+    """
+    template_dir = Path(__file__).parent.parent
+    return CopierTestFixture(template_dir, tmp_path_factory.mktemp("copie-module"), cache=render_cache)
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """Session-wide scratch directory for tests that only need a few files.
+
+    Tests allocate their own uniquely named subdirectory (e.g. from
+    ``request.node.name``) instead of a fresh ``tmp_path`` each.
+    """
+    return tmp_path_factory.mktemp("shared")
 
 
 @pytest.fixture
-def copie_custom_values(tmp_path):
+def copie_custom_values(tmp_path, render_cache):
     """Fixture that provides a copier helper with custom (non-default) values.
 
     Useful for testing that template variables propagate correctly
     when users provide their own values.
     """
     template_dir = Path(__file__).parent.parent
-    fixture = CopierTestFixture(template_dir, tmp_path)
+    fixture = CopierTestFixture(template_dir, tmp_path, cache=render_cache)
 
     # Pre-configured with custom values
     fixture.custom_answers = {
@@ -99,14 +362,14 @@ def copie_custom_values(tmp_path):
 
 
 @pytest.fixture
-def copie_edge_cases(tmp_path):
+def copie_edge_cases(tmp_path, render_cache):
     """Fixture that provides a copier helper with edge case values.
 
     Tests empty strings, unicode, and special characters to ensure
     robust template handling.
     """
     template_dir = Path(__file__).parent.parent
-    fixture = CopierTestFixture(template_dir, tmp_path)
+    fixture = CopierTestFixture(template_dir, tmp_path, cache=render_cache)
 
     # Pre-configured with edge case values
     fixture.edge_case_answers = {
@@ -125,13 +388,13 @@ def copie_edge_cases(tmp_path):
 
 
 @pytest.fixture
-def copie_minimal(tmp_path):
+def copie_minimal(tmp_path, render_cache):
     """Fixture that provides minimal configuration (all optional features disabled).
 
     Useful for testing the minimal viable generated project.
     """
     template_dir = Path(__file__).parent.parent
-    fixture = CopierTestFixture(template_dir, tmp_path)
+    fixture = CopierTestFixture(template_dir, tmp_path, cache=render_cache)
 
     fixture.minimal_answers = {
         "project_name": "Minimal Project",
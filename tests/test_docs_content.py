@@ -8,16 +8,28 @@ This test module validates:
 - Examples documentation (when enabled)
 """
 
+import collections
+import contextlib
+import functools
+import os
+import re
+import subprocess
+import time
+from pathlib import Path
+
 import pytest
 import yaml
 
 
-class SafeMkdocsLoader(yaml.SafeLoader):
+class SafeMkdocsLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
     """Custom YAML loader that handles !!python/name: tags without importing modules.
 
     This is needed because mkdocs.yml contains Material for MkDocs emoji configuration
     with !!python/name: tags that reference Python modules that may not be installed
     during testing. We convert these tags to plain strings for validation purposes.
+
+    The loader builds on libyaml's C parser when PyYAML was compiled with it, and
+    falls back to the pure-Python SafeLoader otherwise.
     """
 
     pass
@@ -32,23 +44,122 @@ def construct_python_name(loader, suffix, node):
 SafeMkdocsLoader.add_multi_constructor("tag:yaml.org,2002:python/name:", construct_python_name)
 
 
+# The docs content tests only inspect these parts of the generated project
+DOCS_ONLY = ("docs", "mkdocs.yml")
+
+# Unrendered Jinja delimiters left in generated files
+_TEMPLATE_LEAK = re.compile(r"\{\{|\}\}")
+
+
+@functools.cache
+def _token_pattern(tokens: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a case-insensitive alternation of literal tokens."""
+    return re.compile("|".join(map(re.escape, tokens)), re.IGNORECASE)
+
+
+def _mentions(text: str, *tokens: str) -> bool:
+    """Check, case-insensitively and in one scan, whether text contains any of the tokens."""
+    return _token_pattern(tokens).search(text) is not None
+
+
+def _tail(path: Path, lines: int = 64) -> str:
+    """Return the last lines of a log file without loading all of it."""
+    with path.open(encoding="utf-8", errors="replace") as log:
+        return "".join(collections.deque(log, maxlen=lines))
+
+
+def _stop(process: subprocess.Popen) -> None:
+    """Kill a process if it is still running and reap it."""
+    if process.poll() is None:
+        process.kill()
+    process.wait()
+
+
+def _at_least_n(text: str, sub: str, n: int) -> bool:
+    """Check whether text contains at least n occurrences of sub, stopping at the nth."""
+    index = 0
+    for _ in range(n):
+        index = text.find(sub, index)
+        if index < 0:
+            return False
+        index += len(sub)
+    return True
+
+
+def _starts_with(path: Path, prefix: bytes) -> bool:
+    """Check whether a file starts with a prefix, reading only the head of the file.
+
+    Leading whitespace is skipped and the comparison ignores ASCII case, which
+    suits probing generated HTML without reading whole pages.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        head = os.pread(fd, len(prefix) + 64, 0)
+    finally:
+        os.close(fd)
+    return head.lstrip().lower().startswith(prefix.lower())
+
+
+def _walk_strings(obj):
+    """Yield every string key and value of a parsed YAML tree."""
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            yield from _walk_strings(key)
+            yield from _walk_strings(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from _walk_strings(item)
+
+
+def _tree_mentions(obj, *tokens: str) -> bool:
+    """Check whether any string in a parsed YAML tree mentions any of the tokens."""
+    return any(_mentions(text, *tokens) for text in _walk_strings(obj))
+
+
+@functools.lru_cache(maxsize=256)
+def _read(path: Path) -> str:
+    """Read a generated file, serving repeated reads of shared renders from memory."""
+    return path.read_text(encoding="utf-8")
+
+
+@functools.cache
+def docs_pages_set(project_dir: Path) -> frozenset[str]:
+    """Return the names of the files in a generated project's docs/pages directory.
+
+    A single directory scan answers every page-existence check for a shared render.
+    """
+    with os.scandir(project_dir / "docs" / "pages") as entries:
+        return frozenset(entry.name for entry in entries if entry.is_file())
+
+
+@functools.cache
+def load_mkdocs(project_dir: Path) -> dict:
+    """Parse the mkdocs.yml of a generated project, once per project directory.
+
+    Projects come from the shared read-only renders of ``copie_cache``, so the
+    parsed configuration can be reused by every test rendering the same answers.
+    """
+    return yaml.load(_read(project_dir / "mkdocs.yml"), Loader=SafeMkdocsLoader)
+
+
 class TestDocsIndexContent:
     """Test the main documentation index page."""
 
-    def test_docs_index_includes_project_info(self, copie):
+    def test_docs_index_includes_project_info(self, copie_cache):
         """Test that docs index includes project metadata."""
         custom_answers = {
             "project_name": "My Awesome Tool",
             "description": "A powerful tool for data analysis",
             "author_name": "Jane Smith",
         }
-        result = copie.copy(extra_answers=custom_answers)
-        assert result.exit_code == 0
+        result = copie_cache(custom_answers, only=DOCS_ONLY)
 
         docs_index = result.project_dir / "docs" / "index.md"
         assert docs_index.is_file()
 
-        content = docs_index.read_text(encoding="utf-8")
+        content = _read(docs_index)
 
         # Should include project name in welcome heading and throughout
         assert "My Awesome Tool" in content
@@ -59,13 +170,12 @@ class TestDocsIndexContent:
         assert "Need Help?" in content
         assert "Learn the Concepts" in content
 
-    def test_docs_index_structure(self, copie):
+    def test_docs_index_structure(self, copie_cache):
         """Test that docs index has proper markdown structure."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
+        result = copie_cache({}, only=DOCS_ONLY)
 
         docs_index = result.project_dir / "docs" / "index.md"
-        content = docs_index.read_text(encoding="utf-8")
+        content = _read(docs_index)
 
         # Should have headings
         assert "#" in content
@@ -77,98 +187,87 @@ class TestDocsIndexContent:
 class TestGettingStartedPage:
     """Test the getting started documentation page."""
 
-    def test_getting_started_exists(self, copie):
+    def test_getting_started_exists(self, copie_cache):
         """Test that getting started page exists."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
+        result = copie_cache({}, only=DOCS_ONLY)
 
-        getting_started = result.project_dir / "docs" / "pages" / "getting-started.md"
-        assert getting_started.is_file()
+        assert "getting-started.md" in docs_pages_set(result.project_dir)
 
-    def test_getting_started_includes_installation(self, copie):
+    def test_getting_started_includes_installation(self, copie_cache):
         """Test that getting started includes installation instructions."""
-        result = copie.copy(extra_answers={"package_name": "my_package"})
-        assert result.exit_code == 0
+        result = copie_cache({"package_name": "my_package"}, only=DOCS_ONLY)
 
         getting_started = result.project_dir / "docs" / "pages" / "getting-started.md"
-        content = getting_started.read_text(encoding="utf-8")
+        content = _read(getting_started)
 
         # Should mention installation
-        assert "install" in content.lower()
+        assert _mentions(content, "install")
 
         # Should include package name in code blocks
         assert "my_package" in content or "my-package" in content
 
-    def test_getting_started_includes_usage_example(self, copie):
+    def test_getting_started_includes_usage_example(self, copie_cache):
         """Test that getting started includes basic usage examples."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
+        result = copie_cache({}, only=DOCS_ONLY)
 
         getting_started = result.project_dir / "docs" / "pages" / "getting-started.md"
-        content = getting_started.read_text(encoding="utf-8")
+        content = _read(getting_started)
 
         # Should have code blocks
         assert "```" in content
 
         # Should mention usage or example
-        assert "usage" in content.lower() or "example" in content.lower()
+        assert _mentions(content, "usage", "example")
 
 
 class TestUserGuidePage:
     """Test the user guide documentation page."""
 
-    def test_user_guide_exists(self, copie):
+    def test_user_guide_exists(self, copie_cache):
         """Test that user guide page exists."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
+        result = copie_cache({}, only=DOCS_ONLY)
 
-        user_guide = result.project_dir / "docs" / "pages" / "user-guide.md"
-        assert user_guide.is_file()
+        assert "user-guide.md" in docs_pages_set(result.project_dir)
 
-    def test_user_guide_has_substantial_content(self, copie):
+    def test_user_guide_has_substantial_content(self, copie_cache):
         """Test that user guide has meaningful content."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
+        result = copie_cache({}, only=DOCS_ONLY)
 
         user_guide = result.project_dir / "docs" / "pages" / "user-guide.md"
-        content = user_guide.read_text(encoding="utf-8")
+        content = _read(user_guide)
 
         # Should be non-trivial
         assert len(content.strip()) > 200
 
         # Should have multiple sections
-        assert content.count("#") >= 2
+        assert _at_least_n(content, "#", 2)
 
 
 class TestAPIReferencePage:
     """Test the API reference documentation page."""
 
-    def test_api_reference_exists(self, copie):
+    def test_api_reference_exists(self, copie_cache):
         """Test that API reference page exists."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
+        result = copie_cache({}, only=DOCS_ONLY)
 
-        api_reference = result.project_dir / "docs" / "pages" / "api-reference.md"
-        assert api_reference.is_file()
+        assert "api-reference.md" in docs_pages_set(result.project_dir)
 
-    def test_api_reference_includes_package_name(self, copie):
+    def test_api_reference_includes_package_name(self, copie_cache):
         """Test that API reference mentions the package name."""
-        result = copie.copy(extra_answers={"package_name": "custom_pkg"})
-        assert result.exit_code == 0
+        result = copie_cache({"package_name": "custom_pkg"}, only=DOCS_ONLY)
 
         api_reference = result.project_dir / "docs" / "pages" / "api-reference.md"
-        content = api_reference.read_text(encoding="utf-8")
+        content = _read(api_reference)
 
         # Should reference the package
         assert "custom_pkg" in content
 
-    def test_api_reference_has_code_documentation(self, copie):
+    def test_api_reference_has_code_documentation(self, copie_cache):
         """Test that API reference includes code documentation."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
+        result = copie_cache({}, only=DOCS_ONLY)
 
         api_reference = result.project_dir / "docs" / "pages" / "api-reference.md"
-        content = api_reference.read_text(encoding="utf-8")
+        content = _read(api_reference)
 
         # Should have code blocks or API documentation syntax
         assert "```" in content or "::: " in content  # mkdocstrings syntax
@@ -177,52 +276,47 @@ class TestAPIReferencePage:
 class TestContributingPage:
     """Test the contributing documentation page."""
 
-    def test_contributing_page_exists(self, copie):
+    def test_contributing_page_exists(self, copie_cache):
         """Test that contributing page exists."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
+        result = copie_cache({}, only=DOCS_ONLY)
 
-        contributing = result.project_dir / "docs" / "pages" / "contributing.md"
-        assert contributing.is_file()
+        assert "contributing.md" in docs_pages_set(result.project_dir)
 
-    def test_contributing_includes_development_setup(self, copie):
+    def test_contributing_includes_development_setup(self, copie_cache):
         """Test that contributing page includes development setup."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
+        result = copie_cache({}, only=DOCS_ONLY)
 
         contributing = result.project_dir / "docs" / "pages" / "contributing.md"
-        content = contributing.read_text(encoding="utf-8")
+        content = _read(contributing)
 
         # Should mention development setup
-        assert "develop" in content.lower()
+        assert _mentions(content, "develop")
 
         # Should mention uv (the dependency manager)
         assert "uv" in content
 
-    def test_contributing_includes_testing_info(self, copie):
+    def test_contributing_includes_testing_info(self, copie_cache):
         """Test that contributing page includes testing information."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
+        result = copie_cache({}, only=DOCS_ONLY)
 
         contributing = result.project_dir / "docs" / "pages" / "contributing.md"
-        content = contributing.read_text(encoding="utf-8")
+        content = _read(contributing)
 
         # Should mention testing
-        assert "test" in content.lower()
+        assert _mentions(content, "test")
 
         # Should mention nox or pytest
         assert "nox" in content or "pytest" in content
 
-    def test_contributing_includes_lint_documentation(self, copie):
+    def test_contributing_includes_lint_documentation(self, copie_cache):
         """Test that contributing page documents the lint command with all three interfaces."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
+        result = copie_cache({}, only=DOCS_ONLY)
 
         contributing = result.project_dir / "docs" / "pages" / "contributing.md"
-        content = contributing.read_text(encoding="utf-8")
+        content = _read(contributing)
 
         # Should have lint section
-        assert "Run linters and type checkers" in content or "lint" in content.lower()
+        assert "Run linters and type checkers" in content or _mentions(content, "lint")
 
         # Should document all three ways to run lint
         assert "just lint" in content
@@ -230,17 +324,16 @@ class TestContributingPage:
         assert "uv run ruff check src tests" in content
         assert "uv run ty check src" in content
 
-    def test_contributing_has_github_links_in_questions_section(self, copie):
+    def test_contributing_has_github_links_in_questions_section(self, copie_cache):
         """Test that Questions section has clickable GitHub links."""
         custom_answers = {
             "github_username": "testuser",
             "project_slug": "test-project",
         }
-        result = copie.copy(extra_answers=custom_answers)
-        assert result.exit_code == 0
+        result = copie_cache(custom_answers, only=DOCS_ONLY)
 
         contributing = result.project_dir / "docs" / "pages" / "contributing.md"
-        content = contributing.read_text(encoding="utf-8")
+        content = _read(contributing)
 
         # Should have Questions section
         assert "## Questions?" in content
@@ -251,13 +344,12 @@ class TestContributingPage:
         # Should have GitHub discussions link
         assert "[Start a discussion in the repository](https://github.com/testuser/test-project/discussions)" in content
 
-    def test_contributing_has_proper_semver_list_formatting(self, copie):
+    def test_contributing_has_proper_semver_list_formatting(self, copie_cache):
         """Test that Semantic Versioning section has properly formatted list."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
+        result = copie_cache({}, only=DOCS_ONLY)
 
         contributing = result.project_dir / "docs" / "pages" / "contributing.md"
-        content = contributing.read_text(encoding="utf-8")
+        content = _read(contributing)
 
         # Should have Version Numbering section with Semantic Versioning
         assert "### Version Numbering" in content
@@ -277,13 +369,12 @@ class TestContributingPage:
         assert lines[semver_line_idx + 1].strip() == "", "Missing blank line before list"
         assert "- **Major**" in lines[semver_line_idx + 2]
 
-    def test_contributing_has_improved_mermaid_colors(self, copie):
+    def test_contributing_has_improved_mermaid_colors(self, copie_cache):
         """Test that release process mermaid diagram has improved colors for visibility."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
+        result = copie_cache({}, only=DOCS_ONLY)
 
         contributing = result.project_dir / "docs" / "pages" / "contributing.md"
-        content = contributing.read_text(encoding="utf-8")
+        content = _read(contributing)
 
         # Should have mermaid diagram with improved styling
         assert "```mermaid" in content
@@ -297,45 +388,34 @@ class TestContributingPage:
 class TestExamplesPage:
     """Test the examples documentation page (when enabled)."""
 
-    def test_examples_page_exists_when_enabled(self, copie):
-        """Test that examples page exists when include_examples=True."""
-        result = copie.copy(extra_answers={"include_examples": True})
-        assert result.exit_code == 0
+    @pytest.mark.parametrize("include_examples", [True, False], ids=["enabled", "disabled"])
+    def test_examples_page_exists_only_when_enabled(self, copie_cache, include_examples):
+        """Test that examples page exists exactly when include_examples=True."""
+        result = copie_cache({"include_examples": include_examples}, only=DOCS_ONLY)
 
-        examples_page = result.project_dir / "docs" / "pages" / "examples.md"
-        assert examples_page.is_file()
+        assert ("examples.md" in docs_pages_set(result.project_dir)) is include_examples
 
-    def test_examples_page_not_exists_when_disabled(self, copie):
-        """Test that examples page doesn't exist when include_examples=False."""
-        result = copie.copy(extra_answers={"include_examples": False})
-        assert result.exit_code == 0
-
-        examples_page = result.project_dir / "docs" / "pages" / "examples.md"
-        assert not examples_page.exists()
-
-    def test_examples_page_references_notebooks(self, copie):
+    def test_examples_page_references_notebooks(self, copie_cache):
         """Test that examples page references marimo notebooks."""
-        result = copie.copy(extra_answers={"include_examples": True})
-        assert result.exit_code == 0
+        result = copie_cache({"include_examples": True}, only=DOCS_ONLY)
 
         examples_page = result.project_dir / "docs" / "pages" / "examples.md"
-        content = examples_page.read_text(encoding="utf-8")
+        content = _read(examples_page)
 
         # Should reference examples or notebooks
-        assert "example" in content.lower()
+        assert _mentions(content, "example")
 
         # Should have iframe or links to examples
-        assert "examples/" in content or "iframe" in content.lower()
+        assert "examples/" in content or _mentions(content, "iframe")
 
-    def test_examples_page_uses_marimo_embed_with_inline_code(self, copie):
+    def test_examples_page_uses_marimo_embed_with_inline_code(self, copie_cache):
         """Test that examples page has interactive demo section with standalone notebook link."""
-        result = copie.copy(extra_answers={"include_examples": True})
-        assert result.exit_code == 0
+        result = copie_cache({"include_examples": True}, only=DOCS_ONLY)
 
-        examples_page = result.project_dir / "docs" / "pages" / "examples.md"
-        assert examples_page.is_file()
+        assert "examples.md" in docs_pages_set(result.project_dir)
 
-        content = examples_page.read_text(encoding="utf-8")
+        examples_page = result.project_dir / "docs" / "pages" / "examples.md"
+        content = _read(examples_page)
 
         # Should have Interactive Demo section with standalone notebook link
         assert "## Interactive Demo" in content
@@ -349,22 +429,59 @@ class TestExamplesPage:
 class TestMkdocsConfiguration:
     """Test mkdocs.yml configuration."""
 
-    def test_mkdocs_yml_structure(self, copie):
-        """Test that mkdocs.yml has proper structure."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
+    @pytest.mark.parametrize("include_examples", [True, False], ids=["with-examples", "without-examples"])
+    def test_mkdocs_yml_properties(self, copie_cache, include_examples):
+        """Test mkdocs.yml structure, navigation, theme, plugins, hooks and extensions."""
+        result = copie_cache({"include_examples": include_examples}, only=DOCS_ONLY)
 
         mkdocs_file = result.project_dir / "mkdocs.yml"
         assert mkdocs_file.is_file()
 
-        mkdocs_data = yaml.load(mkdocs_file.read_text(encoding="utf-8"), Loader=SafeMkdocsLoader)
+        mkdocs_data = load_mkdocs(result.project_dir)
 
         # Required fields
         assert "site_name" in mkdocs_data
         assert "nav" in mkdocs_data or "navigation" in mkdocs_data
         assert "theme" in mkdocs_data
 
-    def test_mkdocs_yml_includes_project_metadata(self, copie):
+        # Navigation should have standard pages
+        nav = mkdocs_data.get("nav", [])
+        assert len(nav) > 0
+        assert _tree_mentions(nav, "getting", "start")
+        assert _tree_mentions(nav, "contributing")
+        assert _tree_mentions(nav, "api", "reference")
+
+        # Navigation includes examples only when enabled
+        if include_examples:
+            assert _tree_mentions(nav, "example")
+        else:
+            assert not _tree_mentions(nav, "example")
+
+        # Should use the Material theme
+        theme = mkdocs_data.get("theme", {})
+        if isinstance(theme, dict):
+            assert theme.get("name") == "material"
+        else:
+            assert theme == "material"
+
+        # Should have search plugin
+        assert "plugins" in mkdocs_data
+        assert _tree_mentions(mkdocs_data["plugins"], "search")
+
+        # marimo plugin is not used - we use marimo-embed directive instead
+        assert not _tree_mentions(mkdocs_data["plugins"], "marimo")
+
+        # Should reference docs/hooks.py
+        assert "hooks" in mkdocs_data
+        assert "docs/hooks.py" in mkdocs_data["hooks"]
+
+        # Check that pymdownx.emoji is configured (simplified config without Python name resolution)
+        content = _read(mkdocs_file)
+        assert "pymdownx.emoji" in content
+        # Should NOT have !!python/name tags (these cause issues with some YAML parsers)
+        assert "!!python/name:" not in content
+
+    def test_mkdocs_yml_includes_project_metadata(self, copie_cache):
         """Test that mkdocs.yml includes correct project metadata."""
         custom_answers = {
             "project_name": "Custom Project",
@@ -373,12 +490,9 @@ class TestMkdocsConfiguration:
             "github_username": "custom-org",
             "project_slug": "custom-project",
         }
-        result = copie.copy(extra_answers=custom_answers)
-        assert result.exit_code == 0
+        result = copie_cache(custom_answers, only=DOCS_ONLY)
 
-        mkdocs_file = result.project_dir / "mkdocs.yml"
-        content = mkdocs_file.read_text(encoding="utf-8")
-        mkdocs_data = yaml.load(content, Loader=SafeMkdocsLoader)
+        mkdocs_data = load_mkdocs(result.project_dir)
 
         # Check site_name
         assert mkdocs_data["site_name"] == "Custom Project"
@@ -392,176 +506,39 @@ class TestMkdocsConfiguration:
         assert "custom-org" in mkdocs_data["repo_url"]
         assert "custom-project" in mkdocs_data["repo_url"]
 
-    def test_mkdocs_yml_navigation_structure(self, copie):
-        """Test that mkdocs.yml has proper navigation structure."""
-        result = copie.copy(extra_answers={"include_examples": False})
-        assert result.exit_code == 0
-
-        mkdocs_file = result.project_dir / "mkdocs.yml"
-        mkdocs_data = yaml.load(mkdocs_file.read_text(encoding="utf-8"), Loader=SafeMkdocsLoader)
-
-        nav = mkdocs_data.get("nav", [])
-        assert len(nav) > 0
-
-        # Should have standard pages
-        nav_str = str(nav).lower()
-        assert "getting" in nav_str or "start" in nav_str
-        assert "contributing" in nav_str
-        assert "api" in nav_str or "reference" in nav_str
-
-    def test_mkdocs_yml_navigation_includes_examples_when_enabled(self, copie):
-        """Test that navigation includes examples when enabled."""
-        result = copie.copy(extra_answers={"include_examples": True})
-        assert result.exit_code == 0
-
-        mkdocs_file = result.project_dir / "mkdocs.yml"
-        mkdocs_data = yaml.load(mkdocs_file.read_text(encoding="utf-8"), Loader=SafeMkdocsLoader)
-
-        nav = mkdocs_data.get("nav", [])
-        nav_str = str(nav).lower()
-
-        # Should include examples in navigation
-        assert "example" in nav_str
-
-    def test_mkdocs_yml_navigation_excludes_examples_when_disabled(self, copie):
-        """Test that navigation excludes examples when disabled."""
-        result = copie.copy(extra_answers={"include_examples": False})
-        assert result.exit_code == 0
-
-        mkdocs_file = result.project_dir / "mkdocs.yml"
-        mkdocs_data = yaml.load(mkdocs_file.read_text(encoding="utf-8"), Loader=SafeMkdocsLoader)
-
-        nav = mkdocs_data.get("nav", [])
-        nav_str = str(nav).lower()
-
-        # Should NOT include examples in navigation
-        assert "example" not in nav_str
-
-    def test_mkdocs_yml_uses_material_theme(self, copie):
-        """Test that mkdocs.yml uses Material theme."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
-
-        mkdocs_file = result.project_dir / "mkdocs.yml"
-        mkdocs_data = yaml.load(mkdocs_file.read_text(encoding="utf-8"), Loader=SafeMkdocsLoader)
-
-        theme = mkdocs_data.get("theme", {})
-        if isinstance(theme, dict):
-            assert theme.get("name") == "material"
-        else:
-            assert theme == "material"
-
-    def test_mkdocs_yml_includes_plugins(self, copie):
-        """Test that mkdocs.yml includes necessary plugins."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
-
-        mkdocs_file = result.project_dir / "mkdocs.yml"
-        mkdocs_data = yaml.load(mkdocs_file.read_text(encoding="utf-8"), Loader=SafeMkdocsLoader)
-
-        assert "plugins" in mkdocs_data
-        plugins = mkdocs_data["plugins"]
-
-        # Should have search plugin
-        plugins_str = str(plugins).lower()
-        assert "search" in plugins_str
-
-    def test_mkdocs_yml_includes_marimo_plugin_when_examples_enabled(self, copie):
-        """Test that mkdocs.yml does not include marimo plugin (marimo embed is used instead)."""
-        result = copie.copy(extra_answers={"include_examples": True})
-        assert result.exit_code == 0
-
-        mkdocs_file = result.project_dir / "mkdocs.yml"
-        mkdocs_data = yaml.load(mkdocs_file.read_text(encoding="utf-8"), Loader=SafeMkdocsLoader)
-
-        plugins = mkdocs_data.get("plugins", [])
-        plugins_str = str(plugins).lower()
-
-        # marimo plugin is not used - we use marimo-embed directive instead
-        assert "marimo" not in plugins_str
-
-    def test_mkdocs_yml_excludes_marimo_plugin_when_examples_disabled(self, copie):
-        """Test that mkdocs.yml excludes marimo plugin when examples disabled."""
-        result = copie.copy(extra_answers={"include_examples": False})
-        assert result.exit_code == 0
-
-        mkdocs_file = result.project_dir / "mkdocs.yml"
-        mkdocs_data = yaml.load(mkdocs_file.read_text(encoding="utf-8"), Loader=SafeMkdocsLoader)
-
-        plugins = mkdocs_data.get("plugins", [])
-        plugins_str = str(plugins).lower()
-
-        # Should NOT include marimo plugin
-        assert "marimo" not in plugins_str
-
-    def test_mkdocs_yml_has_hooks_configured(self, copie):
-        """Test that mkdocs.yml has hooks configured."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
-
-        mkdocs_file = result.project_dir / "mkdocs.yml"
-        mkdocs_data = yaml.load(mkdocs_file.read_text(encoding="utf-8"), Loader=SafeMkdocsLoader)
-
-        # Should have hooks section
-        assert "hooks" in mkdocs_data
-        hooks = mkdocs_data["hooks"]
-
-        # Should reference docs/hooks.py
-        assert "docs/hooks.py" in hooks
-
-    def test_mkdocs_yml_has_emoji_extension_configured(self, copie):
-        """Test that mkdocs.yml has emoji extension configured."""
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
-
-        mkdocs_file = result.project_dir / "mkdocs.yml"
-        assert mkdocs_file.is_file()
-
-        # Read as text to check for the emoji extension
-        content = mkdocs_file.read_text(encoding="utf-8")
-
-        # Check that pymdownx.emoji is configured (simplified config without Python name resolution)
-        assert "pymdownx.emoji" in content
-        # Should NOT have !!python/name tags (these cause issues with some YAML parsers)
-        assert "!!python/name:" not in content
-
 
 class TestDocumentationVariableSubstitution:
     """Test that template variables are correctly substituted in all docs."""
 
-    def test_all_docs_use_correct_package_name(self, copie):
+    def test_all_docs_use_correct_package_name(self, copie_cache):
         """Test that all documentation uses the correct package name."""
-        result = copie.copy(extra_answers={"package_name": "my_custom_pkg"})
-        assert result.exit_code == 0
+        result = copie_cache({"package_name": "my_custom_pkg"}, only=DOCS_ONLY)
 
-        docs_pages = [
-            result.project_dir / "docs" / "index.md",
-            result.project_dir / "docs" / "pages" / "getting-started.md",
-            result.project_dir / "docs" / "pages" / "api-reference.md",
-        ]
+        docs_dir = result.project_dir / "docs"
+        docs_pages = {"index.md", "pages/getting-started.md", "pages/api-reference.md"}
 
-        for page in docs_pages:
-            if page.exists():
-                content = page.read_text(encoding="utf-8")
+        # One walk of docs/ finds whichever of the pages exist
+        for page in docs_dir.glob("**/*.md"):
+            if page.relative_to(docs_dir).as_posix() in docs_pages:
+                content = _read(page)
 
                 # Should not have template placeholders
-                assert "{{" not in content
-                assert "}}" not in content
+                assert not _TEMPLATE_LEAK.search(content)
                 assert "package_name" not in content or "my_custom_pkg" in content
 
-    def test_docs_use_correct_github_username(self, copie):
+    def test_docs_use_correct_github_username(self, copie_cache):
         """Test that documentation uses correct GitHub username in URLs."""
-        result = copie.copy(
-            extra_answers={
+        result = copie_cache(
+            {
                 "github_username": "my-custom-org",
                 "project_slug": "my-project",
-            }
+            },
+            only=DOCS_ONLY,
         )
-        assert result.exit_code == 0
 
         # Check mkdocs.yml
         mkdocs_file = result.project_dir / "mkdocs.yml"
-        content = mkdocs_file.read_text(encoding="utf-8")
+        content = _read(mkdocs_file)
 
         assert "my-custom-org" in content
         assert "github.com/my-custom-org/my-project" in content
@@ -569,7 +546,7 @@ class TestDocumentationVariableSubstitution:
         # Check contributing page
         contributing = result.project_dir / "docs" / "pages" / "contributing.md"
         if contributing.exists():
-            contrib_content = contributing.read_text(encoding="utf-8")
+            contrib_content = _read(contributing)
             # Should reference the correct repository
             assert "my-custom-org" in contrib_content or "my-project" in contrib_content
 
@@ -579,52 +556,41 @@ class TestDocumentationBuildIntegration:
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_docs_build_succeeds_with_examples(self, copie):
-        """Test that docs build successfully with examples enabled."""
-        import subprocess
-
-        result = copie.copy(extra_answers={"include_examples": True})
-        assert result.exit_code == 0
-
-        # Try to build docs
-        build_result = subprocess.run(
-            ["uvx", "nox", "-s", "build_docs"],
-            cwd=result.project_dir,
-            capture_output=True,
-            text=True,
-            timeout=120,
-            check=False,
-        )
-
-        assert build_result.returncode == 0, f"Docs build failed: {build_result.stderr}"
-
-        # Check that site was generated
-        site_dir = result.project_dir / "site"
-        assert site_dir.is_dir()
-        assert (site_dir / "index.html").is_file()
-
-    @pytest.mark.integration
-    @pytest.mark.slow
-    def test_docs_build_succeeds_without_examples(self, copie):
-        """Test that docs build successfully without examples."""
-        import subprocess
-
-        result = copie.copy(extra_answers={"include_examples": False})
-        assert result.exit_code == 0
-
-        # Try to build docs
-        build_result = subprocess.run(
-            ["uvx", "nox", "-s", "build_docs"],
-            cwd=result.project_dir,
-            capture_output=True,
-            text=True,
-            timeout=120,
-            check=False,
-        )
-
-        assert build_result.returncode == 0, f"Docs build failed: {build_result.stderr}"
-
-        # Check that site was generated
-        site_dir = result.project_dir / "site"
-        assert site_dir.is_dir()
-        assert (site_dir / "index.html").is_file()
+    def test_docs_build_succeeds_with_and_without_examples(self, copie, tmp_path, uv_cache_env):
+        """Test that docs build successfully with examples enabled and disabled.
+
+        The two builds are independent, so they run concurrently instead of one
+        after the other.
+        """
+        builds = {}
+        with contextlib.ExitStack() as stack:
+            for label, include_examples in [("with-examples", True), ("without-examples", False)]:
+                result = copie.copy(extra_answers={"include_examples": include_examples}, dirname=label)
+                assert result.exit_code == 0
+
+                # Discard stdout and send stderr to a file, so a chatty build never
+                # blocks on a full pipe and its log is never held in memory
+                stderr_file = stack.enter_context((tmp_path / f"{label}.stderr").open("w", encoding="utf-8"))
+                process = subprocess.Popen(
+                    ["uvx", "nox", "-s", "build_docs"],
+                    cwd=result.project_dir,
+                    env=uv_cache_env,
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr_file,
+                )
+                # Any build still running when the block exits is killed and reaped
+                stack.callback(_stop, process)
+                builds[label] = (result.project_dir, process)
+
+            deadline = time.monotonic() + 120
+            for _, process in builds.values():
+                process.wait(timeout=max(deadline - time.monotonic(), 0))
+
+        for label, (project_dir, process) in builds.items():
+            assert process.returncode == 0, f"Docs build failed ({label}): {_tail(tmp_path / f'{label}.stderr')}"
+
+            # Check that site was generated
+            site_dir = project_dir / "site"
+            assert site_dir.is_dir()
+            assert (site_dir / "index.html").is_file()
+            assert _starts_with(site_dir / "index.html", b"<!doctype html")
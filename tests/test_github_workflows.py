@@ -7,262 +7,263 @@ This test module validates:
 - Integration between workflows (tests, publish, changelog, nightly)
 """
 
+import os
+import re
+from pathlib import Path
+
+import pytest
+import yaml
+
+# The workflow tests only inspect the generated .github directory
+WORKFLOWS_ONLY = (".github",)
+
+# Tokens the workflow tests look for, collected from each file in a single scan
+_WORKFLOW_TOKENS = re.compile(
+    r"astral-sh/setup-uv|uv tool install nox|uvx nox|uv build|gh-action-pypi-publish|upload-artifact"
+)
+
+# uv tokens each workflow must contain; building happens in changelog.yml, not publish-release.yml
+_UV_REQUIREMENTS = {
+    "tests.yml": frozenset({"astral-sh/setup-uv", "uv tool install nox"}),
+    "changelog.yml": frozenset({"astral-sh/setup-uv", "uv build"}),
+    "nightly.yml": frozenset({"astral-sh/setup-uv", "uv tool install nox"}),
+}
+
+
+class WorkflowLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
+    """YAML loader that keeps the ``on`` key of GitHub Actions workflows a string.
+
+    YAML 1.1 resolves bare ``on``/``off``/``yes``/``no`` to booleans, which would
+    turn the trigger section into the key ``True``. This loader only treats
+    ``true`` and ``false`` as booleans, as GitHub Actions does.
+    """
+
+
+WorkflowLoader.yaml_implicit_resolvers = {
+    first: [(tag, regexp) for tag, regexp in resolvers if tag != "tag:yaml.org,2002:bool"]
+    for first, resolvers in WorkflowLoader.yaml_implicit_resolvers.items()
+}
+WorkflowLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:bool", re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$"), list("tTfF")
+)
+
+
+def _permissions(workflow: dict) -> list[dict]:
+    """Return the workflow-level and job-level permission blocks of a workflow."""
+    blocks = [workflow.get("permissions"), *(job.get("permissions") for job in workflow["jobs"].values())]
+    return [block for block in blocks if block is not None]
+
+
+def _job_needs(job: dict) -> list[str]:
+    """Return the jobs a workflow job depends on, whether given as a string or a list."""
+    needs = job.get("needs", [])
+    return [needs] if isinstance(needs, str) else needs
+
+
+def _environment_name(job: dict) -> str | None:
+    """Return the deployment environment of a workflow job, whether given as a string or a mapping."""
+    environment = job.get("environment")
+    return environment.get("name") if isinstance(environment, dict) else environment
+
+
+# Release pipeline properties as (workflow file, predicate on parsed workflow and token set)
+PUBLISH_CASES = [
+    # Modern workflow triggers on pull_request close (changelog PR merge)
+    pytest.param(
+        "publish-release.yml",
+        lambda workflow, tokens: "pull_request" in workflow["on"] or "tags" in (workflow["on"].get("push") or {}),
+        id="publish-triggered-on-changelog-merge",
+    ),
+    # PyPI publishing happens in publish-release.yml workflow
+    pytest.param(
+        "publish-release.yml",
+        lambda workflow, tokens: "pypi-publish" in workflow["jobs"] or "pypi_publish" in workflow["jobs"],
+        id="publish-has-pypi-job",
+    ),
+    # Should use environment for manual approval
+    pytest.param(
+        "publish-release.yml",
+        lambda workflow, tokens: any(_environment_name(job) == "pypi" for job in workflow["jobs"].values()),
+        id="publish-uses-pypi-environment",
+    ),
+    # Should use PyPI upload action with Trusted Publishing
+    pytest.param(
+        "publish-release.yml",
+        lambda workflow, tokens: "gh-action-pypi-publish" in tokens,
+        id="publish-uses-pypi-publish-action",
+    ),
+    pytest.param(
+        "publish-release.yml",
+        lambda workflow, tokens: any(block.get("id-token") == "write" for block in _permissions(workflow)),
+        id="publish-uses-trusted-publishing",
+    ),
+    pytest.param(
+        "publish-release.yml",
+        lambda workflow, tokens: any("release" in name for name in workflow["jobs"]),
+        id="publish-creates-github-release",
+    ),
+    pytest.param(
+        "publish-release.yml",
+        lambda workflow, tokens: "create-release" in _job_needs(workflow["jobs"].get("pypi-publish", {})),
+        id="publish-pypi-job-needs-release",
+    ),
+    # Changelog workflow builds and stores packages but does not publish them
+    pytest.param(
+        "changelog.yml",
+        lambda workflow, tokens: not {"pypi-publish", "pypi_publish"} & workflow["jobs"].keys(),
+        id="changelog-has-no-pypi-job",
+    ),
+    pytest.param("changelog.yml", lambda workflow, tokens: "uv build" in tokens, id="changelog-builds-with-uv"),
+    pytest.param("changelog.yml", lambda workflow, tokens: "upload-artifact" in tokens, id="changelog-uploads-dists"),
+]
+
+
+class RenderedWorkflows:
+    """Shared render of the generated workflows, listed, read and parsed once."""
+
+    def __init__(self, result):
+        self.project_dir = result.project_dir
+        self.workflows_dir = result.project_dir / ".github" / "workflows"
+        try:
+            with os.scandir(self.workflows_dir) as it:
+                entries = list(it)
+        except FileNotFoundError:
+            entries = []
+        self.workflow_files = frozenset(entry.name for entry in entries)
+        self.workflow_texts = {
+            entry.name: Path(entry.path).read_text(encoding="utf-8")
+            for entry in entries
+            if entry.name.endswith(".yml") and entry.is_file()
+        }
+        self.workflow_texts_lower = {name: text.lower() for name, text in self.workflow_texts.items()}
+        self.workflow_yaml = {
+            name: yaml.load(text, Loader=WorkflowLoader) for name, text in self.workflow_texts.items()
+        }
+        self.workflow_tokens = {name: set(_WORKFLOW_TOKENS.findall(text)) for name, text in self.workflow_texts.items()}
+
+
+@pytest.fixture(scope="module")
+def rendered_actions_on(copie_cache):
+    """Fixture that renders the project with workflows once for the whole module.
+
+    The tests only read workflow files, so they all share this render.
+    """
+    return RenderedWorkflows(copie_cache({"include_actions": True}, only=WORKFLOWS_ONLY))
+
+
+@pytest.fixture(scope="module")
+def rendered_actions_off(copie_cache):
+    """Fixture that renders the project without workflows once for the whole module."""
+    return RenderedWorkflows(copie_cache({"include_actions": False}, only=WORKFLOWS_ONLY))
+
 
 class TestWorkflowGeneration:
     """Test that workflows are generated correctly based on options."""
 
-    def test_workflows_included_when_enabled(self, copie):
+    def test_workflows_included_when_enabled(self, rendered_actions_on):
         """Test that all expected workflows exist when include_actions=True."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
-
-        workflows_dir = result.project_dir / ".github" / "workflows"
-        assert workflows_dir.is_dir()
+        result = rendered_actions_on
 
-        expected_workflows = [
+        expected_workflows = {
             "tests.yml",
             "publish-release.yml",
             "changelog.yml",
             "nightly.yml",
             "pr-title.yml",
-        ]
+        }
 
-        for workflow_file in expected_workflows:
-            workflow_path = workflows_dir / workflow_file
-            assert workflow_path.is_file(), f"Missing workflow: {workflow_file}"
+        missing = expected_workflows - result.workflow_files
+        assert not missing, f"Missing workflows: {sorted(missing)}"
 
-    def test_workflows_excluded_when_disabled(self, copie):
+    def test_workflows_excluded_when_disabled(self, rendered_actions_off):
         """Test that no workflows exist when include_actions=False."""
-        result = copie.copy(extra_answers={"include_actions": False})
-        assert result.exit_code == 0
+        result = rendered_actions_off
 
-        workflows_dir = result.project_dir / ".github" / "workflows"
-        # .github directory should not exist or workflows should be empty
-        if workflows_dir.exists():
-            assert len(list(workflows_dir.iterdir())) == 0
+        # .github/workflows should not exist or should be empty
+        assert not result.workflow_files
 
 
 class TestTestsWorkflow:
     """Test the tests.yml workflow configuration."""
 
-    def test_tests_workflow_structure(self, copie):
+    def test_tests_workflow_structure(self, rendered_actions_on):
         """Test tests.yml has correct structure and jobs."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflow_path = result.project_dir / ".github" / "workflows" / "tests.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
+        workflow_lower = result.workflow_texts_lower["tests.yml"]
+        workflow = result.workflow_yaml["tests.yml"]
 
-        # Use string-based validation since GitHub Actions YAML has expressions
-        # that cannot be parsed by standard YAML parsers
-        assert "name:" in workflow_content
-        assert "test" in workflow_content.lower() or "ci" in workflow_content.lower()
+        assert "name" in workflow
+        assert "test" in workflow_lower or "ci" in workflow_lower
 
         # Check triggers
-        assert "on:" in workflow_content
-        assert "push:" in workflow_content or "pull_request:" in workflow_content
+        assert {"push", "pull_request"} & workflow["on"].keys()
 
         # Check jobs
-        assert "jobs:" in workflow_content
-
-    def test_tests_workflow_uses_uv(self, copie):
-        """Test that tests workflow uses uv for dependency management."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
-
-        workflow_path = result.project_dir / ".github" / "workflows" / "tests.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
+        assert workflow["jobs"]
 
-        # Should use uv action or install uv
-        assert "astral-sh/setup-uv" in workflow_content or "uv" in workflow_content
-
-        # Should install nox via uv tool
-        assert "uv tool install nox" in workflow_content or "uvx nox" in workflow_content
-
-    def test_tests_workflow_matrix_strategy(self, copie):
+    def test_tests_workflow_matrix_strategy(self, rendered_actions_on):
         """Test that tests workflow uses matrix for Python versions."""
-        result = copie.copy(extra_answers={"include_actions": True, "min_python_version": "3.11"})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflow_path = result.project_dir / ".github" / "workflows" / "tests.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
+        workflow = result.workflow_yaml["tests.yml"]
 
-        # Use string-based validation since GitHub Actions YAML has expressions
-        assert "strategy:" in workflow_content
-        assert "matrix:" in workflow_content
-        assert "python-version:" in workflow_content or "python:" in workflow_content
+        matrices = [job["strategy"]["matrix"] for job in workflow["jobs"].values() if "strategy" in job]
+        assert matrices, "No job uses a matrix strategy"
+        assert any({"python-version", "python"} & matrix.keys() for matrix in matrices)
 
-    def test_tests_workflow_includes_doctest(self, copie):
+    def test_tests_workflow_includes_doctest(self, rendered_actions_on):
         """Test that tests workflow includes test_docstrings job."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflow_path = result.project_dir / ".github" / "workflows" / "tests.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
+        workflow_lower = result.workflow_texts_lower["tests.yml"]
 
         # Should have test_docstrings job or step
-        assert "test_docstrings" in workflow_content.lower()
-
-    def test_tests_workflow_includes_examples_when_enabled(self, copie):
-        """Test that tests workflow includes examples job when enabled."""
-        result = copie.copy(extra_answers={"include_actions": True, "include_examples": True})
-        assert result.exit_code == 0
-
-        workflow_path = result.project_dir / ".github" / "workflows" / "tests.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
-
-        # Should have examples job or test_examples
-        assert "example" in workflow_content.lower()
+        assert "test_docstrings" in workflow_lower
 
-    def test_tests_workflow_excludes_examples_when_disabled(self, copie):
-        """Test that tests workflow excludes examples when disabled."""
-        result = copie.copy(extra_answers={"include_actions": True, "include_examples": False})
-        assert result.exit_code == 0
+    @pytest.mark.parametrize(
+        ("rendered_fixture", "expect_examples"),
+        [("rendered_examples_on", True), ("rendered_examples_off", False)],
+    )
+    def test_tests_workflow_examples_follow_option(self, request, rendered_fixture, expect_examples):
+        """Test that tests workflow runs the examples only when they are enabled."""
+        result = RenderedWorkflows(request.getfixturevalue(rendered_fixture))
 
-        workflow_path = result.project_dir / ".github" / "workflows" / "tests.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
-
-        # Should NOT have examples-related content
-        assert "test_examples" not in workflow_content and "run-examples" not in workflow_content
+        if expect_examples:
+            # Should have examples job or test_examples
+            assert "example" in result.workflow_texts_lower["tests.yml"]
+        else:
+            # Should NOT have examples-related content
+            workflow_content = result.workflow_texts["tests.yml"]
+            assert "test_examples" not in workflow_content and "run-examples" not in workflow_content
 
 
 class TestPublishWorkflow:
     """Test the publish-release.yml workflow."""
 
-    def test_publish_workflow_exists(self, copie):
-        """Test that publish workflow exists when actions enabled."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
-
-        workflow_path = result.project_dir / ".github" / "workflows" / "publish-release.yml"
-        assert workflow_path.is_file()
-
-    def test_publish_workflow_triggered_on_tags(self, copie):
-        """Test that publish workflow triggers when changelog PR is merged."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
-
-        workflow_path = result.project_dir / ".github" / "workflows" / "publish-release.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
-
-        # Use string-based validation since GitHub Actions YAML has expressions
-        # Modern workflow triggers on pull_request close (changelog PR merge)
-        assert "on:" in workflow_content
-        assert ("pull_request:" in workflow_content) or ("push:" in workflow_content and "tags:" in workflow_content)
-
-    def test_publish_workflow_uses_uv(self, copie):
-        """Test that the build/publish workflow uses uv for building."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
-
-        # Building happens in changelog.yml workflow, not publish-release.yml
-        workflow_path = result.project_dir / ".github" / "workflows" / "changelog.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
-
-        # Should use uv for building
-        assert "uv build" in workflow_content or "uv" in workflow_content
-
-    def test_publish_workflow_has_pypi_upload(self, copie):
-        """Test that publish workflow uploads to PyPI with manual approval."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
-
-        # PyPI publishing now happens in publish-release.yml workflow
-        workflow_path = result.project_dir / ".github" / "workflows" / "publish-release.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
-
-        # Should have pypi-publish job
-        assert "pypi-publish" in workflow_content or "pypi" in workflow_content.lower()
-
-        # Should use environment for manual approval
-        assert "environment:" in workflow_content
-        assert "name: pypi" in workflow_content
-
-        # Should use PyPI upload action with Trusted Publishing
-        assert "gh-action-pypi-publish" in workflow_content
-        assert "id-token: write" in workflow_content
+    @pytest.mark.parametrize(("workflow_file", "predicate"), PUBLISH_CASES)
+    def test_publish_workflow_property(self, rendered_actions_on, workflow_file, predicate):
+        """Test one property of the release pipeline split between changelog and publish workflows."""
+        result = rendered_actions_on
 
-    def test_publish_workflow_creates_github_release(self, copie):
-        """Test that publish workflow creates GitHub release."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
-
-        workflow_path = result.project_dir / ".github" / "workflows" / "publish-release.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
-
-        # Should create GitHub release
-        assert "release" in workflow_content.lower()
-
-    def test_publish_workflow_pypi_job_dependencies(self, copie):
-        """Test that pypi-publish job depends on create-release job."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
-
-        workflow_path = result.project_dir / ".github" / "workflows" / "publish-release.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
-
-        # Should have pypi-publish job with needs dependency
-        assert "pypi-publish" in workflow_content or "pypi_publish" in workflow_content
-
-        # Verify job dependency structure
-        lines = workflow_content.split("\n")
-        in_pypi_job = False
-        has_needs = False
-
-        for line in lines:
-            if "pypi-publish:" in line or "pypi_publish:" in line:
-                in_pypi_job = True
-            elif in_pypi_job and line.strip().startswith("needs:"):
-                has_needs = True
-            elif in_pypi_job and "create-release" in line:
-                # Found the dependency
-                assert has_needs or "needs:" in line, "pypi-publish should depend on create-release"
-                break
-            elif in_pypi_job and line.strip() and not line.startswith(" ") and not line.startswith("\t"):
-                # Started a new job, stop looking
-                break
-
-        # Verify environment is set for manual approval
-        assert "environment:" in workflow_content
-        assert "name: pypi" in workflow_content
-
-    def test_changelog_workflow_no_pypi_job(self, copie):
-        """Test that changelog workflow does not publish to PyPI."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
-
-        workflow_path = result.project_dir / ".github" / "workflows" / "changelog.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
-
-        # Should NOT have pypi-publish job (moved to publish-release.yml)
-        assert "pypi-publish:" not in workflow_content
-        assert "pypi_publish:" not in workflow_content
-
-        # But should still build packages
-        assert "uv build" in workflow_content or "build" in workflow_content.lower()
-
-        # Should store artifacts
-        assert "upload-artifact" in workflow_content
+        assert workflow_file in result.workflow_yaml, f"Missing workflow: {workflow_file}"
+        assert predicate(result.workflow_yaml[workflow_file], result.workflow_tokens[workflow_file])
 
 
 class TestChangelogWorkflow:
     """Test the changelog.yml workflow."""
 
-    def test_changelog_workflow_exists(self, copie):
+    def test_changelog_workflow_exists(self, rendered_actions_on):
         """Test that changelog workflow exists when actions enabled."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflow_path = result.project_dir / ".github" / "workflows" / "changelog.yml"
-        assert workflow_path.is_file()
+        assert "changelog.yml" in result.workflow_files
 
-    def test_changelog_workflow_uses_git_cliff(self, copie):
+    def test_changelog_workflow_uses_git_cliff(self, rendered_actions_on):
         """Test that changelog workflow uses git-cliff."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflow_path = result.project_dir / ".github" / "workflows" / "changelog.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
+        workflow_content = result.workflow_texts["changelog.yml"]
 
         # Should use git-cliff action
         assert "git-cliff" in workflow_content
@@ -270,100 +271,76 @@ class TestChangelogWorkflow:
         # Should use CHANGELOG_AUTOMATION_TOKEN
         assert "CHANGELOG_AUTOMATION_TOKEN" in workflow_content
 
-    def test_changelog_workflow_triggered_on_tags(self, copie):
+    def test_changelog_workflow_triggered_on_tags(self, rendered_actions_on):
         """Test that changelog workflow triggers on version tags."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflow_path = result.project_dir / ".github" / "workflows" / "changelog.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
+        triggers = result.workflow_yaml["changelog.yml"]["on"]
 
-        # Use string-based validation since GitHub Actions YAML has expressions
-        assert "on:" in workflow_content
-        assert "push:" in workflow_content
-        assert "tags:" in workflow_content
+        assert "tags" in (triggers.get("push") or {})
 
 
 class TestNightlyWorkflow:
     """Test the nightly.yml workflow."""
 
-    def test_nightly_workflow_exists(self, copie):
+    def test_nightly_workflow_exists(self, rendered_actions_on):
         """Test that nightly workflow exists when actions enabled."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflow_path = result.project_dir / ".github" / "workflows" / "nightly.yml"
-        assert workflow_path.is_file()
+        assert "nightly.yml" in result.workflow_files
 
-    def test_nightly_workflow_scheduled(self, copie):
+    def test_nightly_workflow_scheduled(self, rendered_actions_on):
         """Test that nightly workflow runs on schedule."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
-
-        workflow_path = result.project_dir / ".github" / "workflows" / "nightly.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
-
-        # Use string-based validation since GitHub Actions YAML has expressions
-        assert "on:" in workflow_content
-        assert "schedule:" in workflow_content
-        assert "cron:" in workflow_content
-
-    def test_nightly_workflow_uses_uv(self, copie):
-        """Test that nightly workflow uses uv."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflow_path = result.project_dir / ".github" / "workflows" / "nightly.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
+        triggers = result.workflow_yaml["nightly.yml"]["on"]
 
-        # Should use uv
-        assert "uv" in workflow_content
+        assert triggers.get("schedule"), "nightly workflow has no schedule"
+        assert all("cron" in entry for entry in triggers["schedule"])
 
 
 class TestPRTitleWorkflow:
     """Test the pr-title.yml workflow."""
 
-    def test_pr_title_workflow_exists(self, copie):
+    def test_pr_title_workflow_exists(self, rendered_actions_on):
         """Test that PR title workflow exists when actions enabled."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflow_path = result.project_dir / ".github" / "workflows" / "pr-title.yml"
-        assert workflow_path.is_file()
+        assert "pr-title.yml" in result.workflow_files
 
-    def test_pr_title_workflow_validates_conventional_commits(self, copie):
+    def test_pr_title_workflow_validates_conventional_commits(self, rendered_actions_on):
         """Test that PR title workflow validates conventional commit format."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflow_path = result.project_dir / ".github" / "workflows" / "pr-title.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
+        workflow_lower = result.workflow_texts_lower["pr-title.yml"]
 
         # Should validate conventional commit format
-        assert "conventional" in workflow_content.lower() or "commitizen" in workflow_content.lower()
+        assert "conventional" in workflow_lower or "commitizen" in workflow_lower
 
-    def test_pr_title_workflow_triggered_on_pull_request(self, copie):
+    def test_pr_title_workflow_triggered_on_pull_request(self, rendered_actions_on):
         """Test that PR title workflow triggers on pull requests."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflow_path = result.project_dir / ".github" / "workflows" / "pr-title.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
+        triggers = result.workflow_yaml["pr-title.yml"]["on"]
 
-        # Use string-based validation since GitHub Actions YAML has expressions
-        assert "on:" in workflow_content
-        assert "pull_request:" in workflow_content or "pull_request_target:" in workflow_content
+        assert {"pull_request", "pull_request_target"} & triggers.keys()
 
 
 class TestWorkflowConsistency:
     """Test consistency across all workflows."""
 
-    def test_all_workflows_use_consistent_uv_setup(self, copie):
+    @pytest.mark.parametrize(("workflow_file", "required_tokens"), _UV_REQUIREMENTS.items())
+    def test_workflow_uses_uv(self, rendered_actions_on, workflow_file, required_tokens):
+        """Test that workflows use uv for setup, building and running nox."""
+        result = rendered_actions_on
+
+        missing = required_tokens - result.workflow_tokens[workflow_file]
+        assert not missing, f"{workflow_file} is missing {sorted(missing)}"
+
+    def test_all_workflows_use_consistent_uv_setup(self, rendered_actions_on):
         """Test that all workflows use the same uv setup approach."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflows_dir = result.project_dir / ".github" / "workflows"
         workflow_files = [
             "tests.yml",
             "publish-release.yml",
@@ -374,12 +351,10 @@ class TestWorkflowConsistency:
         uv_setup_patterns = []
 
         for workflow_file in workflow_files:
-            workflow_path = workflows_dir / workflow_file
-            if workflow_path.exists():
-                content = workflow_path.read_text(encoding="utf-8")
-
+            tokens = result.workflow_tokens.get(workflow_file)
+            if tokens is not None:
                 # Track if it uses astral-sh/setup-uv action
-                uses_setup_uv_action = "astral-sh/setup-uv" in content
+                uses_setup_uv_action = "astral-sh/setup-uv" in tokens
 
                 uv_setup_patterns.append({
                     "file": workflow_file,
@@ -391,48 +366,36 @@ class TestWorkflowConsistency:
         # They should all be consistent
         assert len(set(uses_action_values)) <= 2, f"Inconsistent uv setup: {uv_setup_patterns}"
 
-    def test_all_workflows_install_nox_consistently(self, copie):
+    def test_all_workflows_install_nox_consistently(self, rendered_actions_on):
         """Test that all workflows that need nox install it the same way."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflows_dir = result.project_dir / ".github" / "workflows"
         workflow_files = ["tests.yml", "nightly.yml"]
 
         for workflow_file in workflow_files:
-            workflow_path = workflows_dir / workflow_file
-            if workflow_path.exists():
-                content = workflow_path.read_text(encoding="utf-8")
-
+            tokens = result.workflow_tokens.get(workflow_file)
+            if tokens is not None:
                 # Should install nox via uv tool
-                assert "uv tool install nox" in content or "uvx nox" in content, (
-                    f"{workflow_file} doesn't install nox consistently"
-                )
+                assert {"uv tool install nox", "uvx nox"} & tokens, f"{workflow_file} doesn't install nox consistently"
 
 
 class TestWorkflowPermissions:
     """Test that workflows have appropriate permissions."""
 
-    def test_publish_workflow_has_appropriate_permissions(self, copie):
+    def test_publish_workflow_has_appropriate_permissions(self, rendered_actions_on):
         """Test that publish workflow has necessary permissions."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflow_path = result.project_dir / ".github" / "workflows" / "publish-release.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
+        workflow = result.workflow_yaml["publish-release.yml"]
 
-        # Use string-based validation since GitHub Actions YAML has expressions
         # Should have permissions for PyPI trusted publishing and GitHub release
-        assert "permissions:" in workflow_content
+        assert _permissions(workflow)
 
-    def test_changelog_workflow_has_write_permissions(self, copie):
+    def test_changelog_workflow_has_write_permissions(self, rendered_actions_on):
         """Test that changelog workflow can write to repository."""
-        result = copie.copy(extra_answers={"include_actions": True})
-        assert result.exit_code == 0
+        result = rendered_actions_on
 
-        workflow_path = result.project_dir / ".github" / "workflows" / "changelog.yml"
-        workflow_content = workflow_path.read_text(encoding="utf-8")
+        workflow = result.workflow_yaml["changelog.yml"]
 
-        # Use string-based validation since GitHub Actions YAML has expressions
         # Should have permissions for writing to contents
-        assert "permissions:" in workflow_content
+        assert any(block.get("contents") == "write" for block in _permissions(workflow))
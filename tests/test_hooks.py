@@ -1,12 +1,129 @@
 """Tests for mkdocs hooks functionality."""
 
+import functools
+import hashlib
+import importlib.util
+import os
+import re
+import shutil
+import stat
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+
 import pytest
 
+# Hook names and export markers the hooks.py tests look for, found in one scan
+_HOOKS_TOKENS = re.compile(r"on_pre_build|on_files|on_post_build|marimo|export|html-wasm")
+
 
-@pytest.fixture
-def copie_with_examples(copie):
-    """Copy template with examples enabled."""
-    result = copie.copy(
+# HTML samples for the _html_to_markdown tests, converted once per module
+SAMPLE_HTML = {
+    "structure": """
+    <h1>Main Title</h1>
+    <p>This is a paragraph with <strong>bold</strong> and <em>italic</em> text.</p>
+    <pre><code class="language-python">def example():
+    return "hello"</code></pre>
+    <ul>
+        <li>First item</li>
+        <li>Second item</li>
+    </ul>
+    """,
+    "table": """
+    <table>
+        <tr>
+            <th>Header 1</th>
+            <th>Header 2</th>
+        </tr>
+        <tr>
+            <td>Cell 1</td>
+            <td>Cell 2</td>
+        </tr>
+    </table>
+    """,
+}
+
+
+# Built pages as (HTML, exported markdown) paths relative to the site directory
+PAGE_PATHS = (
+    ("index.html", "index.md"),
+    ("pages/getting-started/index.html", "pages/getting-started.md"),
+    ("pages/user-guide/index.html", "pages/user-guide.md"),
+    ("pages/api-reference/index.html", "pages/api-reference.md"),
+    ("pages/contributing/index.html", "pages/contributing.md"),
+)
+
+
+class ReadCache:
+    """Cache of file contents, revalidated with a single ``stat`` per read.
+
+    Entries are keyed by path, modification time and size, so a file that a test
+    rewrites is read again while unchanged generated files are read only once.
+    """
+
+    def __init__(self):
+        self._contents: dict[tuple[str, int, int], bytes] = {}
+
+    def read(self, path: Path) -> bytes:
+        """Return the contents of ``path``, reading it only if it changed."""
+        st = os.stat(path)
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        if key not in self._contents:
+            self._contents[key] = path.read_bytes()
+        return self._contents[key]
+
+    def read_text(self, path: Path) -> str:
+        """Return the contents of ``path`` decoded as UTF-8."""
+        return self.read(path).decode("utf-8")
+
+
+def _hooks_tokens(hooks_file: Path, file_cache: ReadCache) -> set[str]:
+    """Return the hook tokens present in a generated hooks.py."""
+    return set(_HOOKS_TOKENS.findall(file_cache.read_text(hooks_file)))
+
+
+def _head(path: Path, size: int = 8192) -> str:
+    """Return the lowercased start of a file without reading all of it.
+
+    Exported notebooks bundle the WASM runtime and can be several megabytes.
+    """
+    with path.open("rb") as file:
+        return file.read(size).decode("utf-8", errors="ignore").lower()
+
+
+@functools.cache
+def load_hooks(project_dir: Path) -> ModuleType:
+    """Import the generated ``docs/hooks.py`` of a project as its own module.
+
+    Each project gets a uniquely named module, so hooks never leak between
+    projects through ``sys.modules`` and ``__file__`` always points into the
+    project under test. The module is registered in ``sys.modules`` like mkdocs
+    does.
+    """
+    hooks_path = project_dir / "docs" / "hooks.py"
+    name = f"hooks_{hashlib.sha1(str(hooks_path).encode()).hexdigest()[:12]}"
+    spec = importlib.util.spec_from_file_location(name, hooks_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def file_cache():
+    """Read cache shared by the tests of this module."""
+    return ReadCache()
+
+
+@pytest.fixture(scope="module")
+def copie_with_examples(copie_module):
+    """Copy template with examples enabled, once for the whole module.
+
+    Tests only write to their own site directories, so they share this project.
+    Tests that modify the project itself use ``copie`` for a private copy.
+    """
+    result = copie_module.copy(
         extra_answers={
             "include_examples": True,
         },
@@ -15,174 +132,152 @@ def copie_with_examples(copie):
     return result
 
 
-@pytest.fixture
-def copie_without_examples(copie):
-    """Copy template with examples disabled."""
-    result = copie.copy(
-        extra_answers={
-            "include_examples": False,
-        },
-    )
-    assert result.exit_code == 0
-    return result
+@pytest.fixture(scope="module")
+def hooks_module(copie_with_examples):
+    """Generated hooks of the shared examples project, imported once for the whole module."""
+    return load_hooks(copie_with_examples.project_dir)
+
+
+@pytest.fixture(scope="module")
+def converted(hooks_module):
+    """Markdown conversions of ``SAMPLE_HTML``, computed once for the whole module."""
+    return {name: hooks_module._html_to_markdown(html) for name, html in SAMPLE_HTML.items()}
+
+
+@pytest.fixture(scope="module")
+def built_docs(copie_with_examples, uv_cache_env):
+    """Build the docs of the shared examples project once for the whole module.
+
+    Building runs the marimo export and mkdocs, by far the slowest step of these
+    tests, and every build test only inspects the resulting files. The docs are
+    built with ``uv run`` directly, since test_docs_content already covers the
+    ``build_docs`` nox session itself. The build log is only read back when the
+    build fails, which fails the requesting test.
+    """
+    project_dir = copie_with_examples.project_dir
+    log_path = project_dir.parent / "build_docs.log"
+    with log_path.open("wb") as log:
+        result = subprocess.run(
+            # Same steps as the build_docs nox session, without the uvx and nox processes
+            ["uv", "run", "--no-default-groups", "--group", "docs", "mkdocs", "build", "--clean"],
+            cwd=project_dir,
+            env=uv_cache_env,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            timeout=120,
+            check=False,
+        )
+    if result.returncode != 0:
+        pytest.fail(f"mkdocs build failed:\n{log_path.read_text(errors='replace')}")
+    return project_dir
 
 
-def test_hooks_file_created_with_examples(copie_with_examples):
+def test_hooks_file_created_with_examples(rendered_examples_on, file_cache):
     """Test that hooks.py is created when examples are enabled."""
-    hooks_file = copie_with_examples.project_dir / "docs" / "hooks.py"
+    hooks_file = rendered_examples_on.project_dir / "docs" / "hooks.py"
     assert hooks_file.is_file(), "docs/hooks.py not created"
 
-    # Verify hooks content
-    hooks_content = hooks_file.read_text(encoding="utf-8")
-    assert "on_pre_build" in hooks_content, "on_pre_build hook not found"
-    assert "on_post_build" in hooks_content, "on_post_build hook not found"
+    # Verify hooks content, including the marimo export logic
+    missing = {"on_pre_build", "on_post_build", "marimo", "export", "html-wasm"} - _hooks_tokens(hooks_file, file_cache)
+    assert not missing, f"hooks.py is missing: {sorted(missing)}"
 
-    # Verify marimo export logic is present
-    assert "marimo" in hooks_content, "marimo export logic not found"
-    assert "export" in hooks_content, "export logic not found"
-    assert "html-wasm" in hooks_content, "html-wasm export mode not found"
 
-
-def test_hooks_file_created_without_examples(copie_without_examples):
+def test_hooks_file_created_without_examples(rendered_examples_off, file_cache):
     """Test that hooks.py is created even when examples are disabled."""
-    hooks_file = copie_without_examples.project_dir / "docs" / "hooks.py"
+    hooks_file = rendered_examples_off.project_dir / "docs" / "hooks.py"
     assert hooks_file.is_file(), "docs/hooks.py not created"
 
     # Verify hooks content has minimal implementation
-    hooks_content = hooks_file.read_text(encoding="utf-8")
-    assert "on_post_build" in hooks_content, "on_post_build hook not found"
+    tokens = _hooks_tokens(hooks_file, file_cache)
+    assert "on_post_build" in tokens, "on_post_build hook not found"
 
     # on_pre_build should not exist when examples disabled
-    assert "on_pre_build" not in hooks_content, "on_pre_build should not exist without examples"
+    assert "on_pre_build" not in tokens, "on_pre_build should not exist without examples"
 
 
-def test_on_post_build_copies_markdown(copie_with_examples, tmp_path):
+def test_on_post_build_copies_markdown(copie_with_examples, hooks_module, shared_tmp, request):
     """Test that on_post_build hook copies markdown files."""
-    import sys
-
-    # Add project to path so we can import hooks
-    sys.path.insert(0, str(copie_with_examples.project_dir / "docs"))
-
-    try:
-        import hooks
-
-        # Create mock config
-        site_dir = tmp_path / "site"
-        site_dir.mkdir()
-        docs_dir = copie_with_examples.project_dir / "docs"
+    # Create mock config
+    site_dir = shared_tmp / f"site_{request.node.name}"
+    site_dir.mkdir()
+    docs_dir = copie_with_examples.project_dir / "docs"
 
-        config = {
-            "site_dir": str(site_dir),
-            "docs_dir": str(docs_dir),
-        }
+    config = {
+        "site_dir": str(site_dir),
+        "docs_dir": str(docs_dir),
+    }
 
-        # Call on_post_build
-        hooks.on_post_build(config)
+    # Call on_post_build
+    hooks_module.on_post_build(config)
 
-        # Verify markdown files were copied
-        assert (site_dir / "index.md").is_file(), "index.md not copied"
-        assert (site_dir / "pages" / "getting-started.md").is_file(), "getting-started.md not copied"
-        assert (site_dir / "pages" / "contributing.md").is_file(), "contributing.md not copied"
-
-    finally:
-        sys.path.pop(0)
+    # Verify markdown files were copied
+    assert (site_dir / "index.md").is_file(), "index.md not copied"
+    assert (site_dir / "pages" / "getting-started.md").is_file(), "getting-started.md not copied"
+    assert (site_dir / "pages" / "contributing.md").is_file(), "contributing.md not copied"
 
 
 @pytest.mark.integration
 @pytest.mark.slow
 @pytest.mark.skip(reason="Marimo HTML export feature not fully implemented in examples.md template")
-def test_on_post_build_copies_html(copie_with_examples, tmp_path):
+def test_on_post_build_copies_html(built_docs):
     """Test that on_post_build hook copies standalone HTML files."""
-    import subprocess
-
-    # First export notebooks using build_docs to trigger hooks
-    subprocess.run(
-        ["uvx", "nox", "-s", "build_docs"],
-        cwd=copie_with_examples.project_dir,
-        capture_output=True,
-        timeout=60,
-        check=True,
-    )
-
     # Verify HTML was exported
-    html_file = copie_with_examples.project_dir / "docs" / "examples" / "hello" / "index.html"
+    html_file = built_docs / "docs" / "examples" / "hello" / "index.html"
     assert html_file.is_file(), "HTML file not exported by on_pre_build"
 
     # Verify HTML was also copied to site by on_post_build
-    site_html = copie_with_examples.project_dir / "site" / "examples" / "hello" / "index.html"
-    assert site_html.is_file(), "Standalone HTML not copied to site"
+    site_html = built_docs / "site" / "examples" / "hello" / "index.html"
+    try:
+        site_stat = site_html.stat()
+    except FileNotFoundError:
+        site_stat = None
+    assert site_stat is not None and stat.S_ISREG(site_stat.st_mode), "Standalone HTML not copied to site"
 
-    # Verify the HTML file is substantial (not just a stub)
-    html_size = site_html.stat().st_size
+    # Verify the HTML file is substantial (not just a stub), reusing the same stat
+    html_size = site_stat.st_size
     assert html_size > 10000, f"HTML file too small ({html_size} bytes), may not be properly exported"
 
 
 @pytest.mark.skip(reason="Marimo HTML export feature not fully implemented in examples.md template")
 @pytest.mark.integration
 @pytest.mark.slow
-def test_on_pre_build_exports_notebooks(copie_with_examples):
+def test_on_pre_build_exports_notebooks(built_docs):
     """Test that on_pre_build exports marimo notebooks."""
-    import subprocess
-
-    # Build docs which triggers on_pre_build
-    result = subprocess.run(
-        ["uvx", "nox", "-s", "build_docs"],
-        cwd=copie_with_examples.project_dir,
-        capture_output=True,
-        text=True,
-        timeout=120,
-        check=False,
-    )
-
-    assert result.returncode == 0, f"build_docs failed: {result.stderr}"
-
     # Verify exported HTML exists
-    html_file = copie_with_examples.project_dir / "docs" / "examples" / "hello" / "index.html"
+    html_file = built_docs / "docs" / "examples" / "hello" / "index.html"
     assert html_file.is_file(), "Notebook not exported to HTML"
 
-    # Verify it's a valid HTML file
-    html_content = html_file.read_text(encoding="utf-8")
-    assert "<html" in html_content, "Exported file is not valid HTML"
-    assert "marimo" in html_content.lower(), "HTML doesn't contain marimo runtime"
+    # Verify it's a valid HTML file; the markers live in the document head
+    html_head = _head(html_file)
+    assert "<html" in html_head, "Exported file is not valid HTML"
+    assert "marimo" in html_head, "HTML doesn't contain marimo runtime"
 
 
-def test_on_post_build_handles_missing_examples_dir(copie_with_examples, tmp_path):
+def test_on_post_build_handles_missing_examples_dir(rendered_examples_on, shared_tmp, request):
     """Test that on_post_build gracefully handles missing examples directory."""
-    import sys
+    # Run the hooks from a project that has no examples, leaving the shared render untouched
+    docs_dir = shared_tmp / f"project_{request.node.name}" / "docs"
+    docs_dir.mkdir(parents=True)
+    shutil.copy2(rendered_examples_on.project_dir / "docs" / "hooks.py", docs_dir / "hooks.py")
+    hooks = load_hooks(docs_dir.parent)
 
-    sys.path.insert(0, str(copie_with_examples.project_dir / "docs"))
+    # Create mock config with non-existent examples
+    site_dir = shared_tmp / f"site_{request.node.name}"
+    site_dir.mkdir()
 
-    try:
-        import hooks
-
-        # Create mock config with non-existent examples
-        site_dir = tmp_path / "site"
-        site_dir.mkdir()
-        docs_dir = copie_with_examples.project_dir / "docs"
-
-        config = {
-            "site_dir": str(site_dir),
-            "docs_dir": str(docs_dir),
-        }
-
-        # Remove examples directory if it exists
-        docs_examples = copie_with_examples.project_dir / "docs" / "examples"
-        if docs_examples.exists():
-            import shutil
+    config = {
+        "site_dir": str(site_dir),
+        "docs_dir": str(docs_dir),
+    }
 
-            shutil.rmtree(docs_examples)
+    # Call on_post_build - should not raise
+    hooks.on_post_build(config)
 
-        # Call on_post_build - should not raise
-        hooks.on_post_build(config)
 
-    finally:
-        sys.path.pop(0)
-
-
-def test_hooks_integrated_in_mkdocs_yml(copie_with_examples):
+def test_hooks_integrated_in_mkdocs_yml(copie_with_examples, file_cache):
     """Test that hooks are properly configured in mkdocs.yml."""
     mkdocs_yml = copie_with_examples.project_dir / "mkdocs.yml"
-    content = mkdocs_yml.read_text(encoding="utf-8")
+    content = file_cache.read_text(mkdocs_yml)
 
     assert "hooks:" in content, "hooks section not found in mkdocs.yml"
     assert "docs/hooks.py" in content, "hooks.py not referenced in mkdocs.yml"
@@ -190,24 +285,10 @@ def test_hooks_integrated_in_mkdocs_yml(copie_with_examples):
 
 @pytest.mark.integration
 @pytest.mark.slow
-def test_on_post_build_converts_html_to_markdown(copie_with_examples, tmp_path):
+def test_on_post_build_converts_html_to_markdown(built_docs):
     """Test that on_post_build converts HTML to markdown for LLM consumption."""
-    import subprocess
-
-    # Build docs to generate both HTML and markdown
-    result = subprocess.run(
-        ["uvx", "nox", "-s", "build_docs"],
-        cwd=copie_with_examples.project_dir,
-        capture_output=True,
-        text=True,
-        timeout=60,
-        check=False,
-    )
-
-    assert result.returncode == 0, f"build_docs failed: {result.stderr}"
-
     # Verify markdown files exist in site directory
-    site_dir = copie_with_examples.project_dir / "site"
+    site_dir = built_docs / "site"
     assert (site_dir / "index.md").is_file(), "index.md not found in site"
     assert (site_dir / "pages" / "getting-started.md").is_file(), "getting-started.md not found in site"
     assert (site_dir / "pages" / "api-reference.md").is_file(), "api-reference.md not found"
@@ -218,181 +299,100 @@ def test_on_post_build_converts_html_to_markdown(copie_with_examples, tmp_path):
     assert "# " in index_md, "Markdown doesn't contain headers"
 
 
-def test_on_post_build_copies_llms_txt_if_exists(copie_with_examples, tmp_path):
+def test_on_post_build_copies_llms_txt_if_exists(copie, shared_tmp, request):
     """Test that on_post_build copies llms.txt if it exists."""
-    import sys
+    # Adding llms.txt modifies the project, so use a private copy
+    result = copie.copy(extra_answers={"include_examples": True})
+    hooks = load_hooks(result.project_dir)
 
-    # Add project to path
-    sys.path.insert(0, str(copie_with_examples.project_dir / "docs"))
-
-    try:
-        import hooks
+    # Create llms.txt in docs
+    docs_dir = result.project_dir / "docs"
+    llms_txt = docs_dir / "llms.txt"
+    llms_txt.write_text("# LLM Context\nProject documentation", encoding="utf-8")
 
-        # Create llms.txt in docs
-        docs_dir = copie_with_examples.project_dir / "docs"
-        llms_txt = docs_dir / "llms.txt"
-        llms_txt.write_text("# LLM Context\nProject documentation", encoding="utf-8")
+    site_dir = shared_tmp / f"site_{request.node.name}"
+    site_dir.mkdir()
 
-        site_dir = tmp_path / "site"
-        site_dir.mkdir()
+    config = {
+        "site_dir": str(site_dir),
+        "docs_dir": str(docs_dir),
+    }
 
-        config = {
-            "site_dir": str(site_dir),
-            "docs_dir": str(docs_dir),
-        }
+    # Call on_post_build
+    hooks.on_post_build(config)
 
-        # Call on_post_build
-        hooks.on_post_build(config)
+    # Verify llms.txt was copied
+    assert (site_dir / "llms.txt").is_file(), "llms.txt not copied to site"
+    content = (site_dir / "llms.txt").read_text(encoding="utf-8")
+    assert "LLM Context" in content, "llms.txt content not preserved"
 
-        # Verify llms.txt was copied
-        assert (site_dir / "llms.txt").is_file(), "llms.txt not copied to site"
-        content = (site_dir / "llms.txt").read_text(encoding="utf-8")
-        assert "LLM Context" in content, "llms.txt content not preserved"
 
-    finally:
-        sys.path.pop(0)
-
-
-def test_on_post_build_removes_legacy_llm_directory(copie_with_examples, tmp_path):
+def test_on_post_build_removes_legacy_llm_directory(copie_with_examples, hooks_module, shared_tmp, request):
     """Test that on_post_build removes legacy llm/ directory."""
-    import sys
-
-    sys.path.insert(0, str(copie_with_examples.project_dir / "docs"))
+    docs_dir = copie_with_examples.project_dir / "docs"
+    site_dir = shared_tmp / f"site_{request.node.name}"
+    site_dir.mkdir()
 
-    try:
-        import hooks
-
-        docs_dir = copie_with_examples.project_dir / "docs"
-        site_dir = tmp_path / "site"
-        site_dir.mkdir()
-
-        # Create legacy llm directory
-        legacy_dir = site_dir / "llm"
-        legacy_dir.mkdir()
-        (legacy_dir / "old_file.md").write_text("old content", encoding="utf-8")
-
-        config = {
-            "site_dir": str(site_dir),
-            "docs_dir": str(docs_dir),
-        }
+    # Create legacy llm directory
+    legacy_dir = site_dir / "llm"
+    legacy_dir.mkdir()
+    (legacy_dir / "old_file.md").write_text("old content", encoding="utf-8")
 
-        # Call on_post_build
-        hooks.on_post_build(config)
+    config = {
+        "site_dir": str(site_dir),
+        "docs_dir": str(docs_dir),
+    }
 
-        # Verify legacy directory was removed
-        assert not legacy_dir.exists(), "Legacy llm/ directory not removed"
+    # Call on_post_build
+    hooks_module.on_post_build(config)
 
-    finally:
-        sys.path.pop(0)
+    # Verify legacy directory was removed
+    assert not legacy_dir.exists(), "Legacy llm/ directory not removed"
 
 
-def test_html_to_markdown_conversion_preserves_structure(copie_with_examples):
+def test_html_to_markdown_conversion_preserves_structure(converted):
     """Test that HTML to markdown conversion preserves document structure."""
-    import sys
+    markdown = converted["structure"]
 
-    sys.path.insert(0, str(copie_with_examples.project_dir / "docs"))
+    # Verify structure is preserved
+    assert "# Main Title" in markdown, "H1 not converted"
+    assert "**bold**" in markdown, "Bold not converted"
+    assert "*italic*" in markdown, "Italic not converted"
+    assert "```python" in markdown, "Code fence not created"
+    assert "def example():" in markdown, "Code content not preserved"
+    assert '    return "hello"' in markdown, "Code indentation not preserved"
+    assert "- First item" in markdown or "- First item" in markdown, "List not converted"
 
-    try:
-        import hooks
-
-        # Test HTML with various elements
-        test_html = """
-        <h1>Main Title</h1>
-        <p>This is a paragraph with <strong>bold</strong> and <em>italic</em> text.</p>
-        <pre><code class="language-python">def example():
-    return "hello"</code></pre>
-        <ul>
-            <li>First item</li>
-            <li>Second item</li>
-        </ul>
-        """
 
-        markdown = hooks._html_to_markdown(test_html)
-
-        # Verify structure is preserved
-        assert "# Main Title" in markdown, "H1 not converted"
-        assert "**bold**" in markdown, "Bold not converted"
-        assert "*italic*" in markdown, "Italic not converted"
-        assert "```python" in markdown, "Code fence not created"
-        assert "def example():" in markdown, "Code content not preserved"
-        assert "- First item" in markdown or "- First item" in markdown, "List not converted"
-
-    finally:
-        sys.path.pop(0)
-
-
-def test_html_to_markdown_handles_tables(copie_with_examples):
+def test_html_to_markdown_handles_tables(converted):
     """Test that HTML to markdown conversion handles tables correctly."""
-    import sys
-
-    sys.path.insert(0, str(copie_with_examples.project_dir / "docs"))
-
-    try:
-        import hooks
+    markdown = converted["table"]
 
-        test_html = """
-        <table>
-            <tr>
-                <th>Header 1</th>
-                <th>Header 2</th>
-            </tr>
-            <tr>
-                <td>Cell 1</td>
-                <td>Cell 2</td>
-            </tr>
-        </table>
-        """
-
-        markdown = hooks._html_to_markdown(test_html)
-
-        # Verify table structure
-        assert "|" in markdown, "Table pipes not found"
-        assert "---" in markdown, "Table separator not found"
-        assert "Header 1" in markdown, "Table headers not preserved"
-        assert "Cell 1" in markdown, "Table cells not preserved"
-
-    finally:
-        sys.path.pop(0)
+    # Verify table structure
+    assert "|" in markdown, "Table pipes not found"
+    assert "---" in markdown, "Table separator not found"
+    assert "Header 1" in markdown, "Table headers not preserved"
+    assert "Cell 1" in markdown, "Table cells not preserved"
 
 
 @pytest.mark.integration
 @pytest.mark.slow
-def test_markdown_accessible_after_docs_build(copie_with_examples):
+def test_markdown_accessible_after_docs_build(built_docs):
     """Test that markdown files are accessible after docs build completes."""
-    import subprocess
-
-    # Build docs
-    result = subprocess.run(
-        ["uvx", "nox", "-s", "build_docs"],
-        cwd=copie_with_examples.project_dir,
-        capture_output=True,
-        text=True,
-        timeout=60,
-        check=False,
-    )
-
-    assert result.returncode == 0, f"build_docs failed: {result.stderr}"
+    site_dir = built_docs / "site"
 
-    site_dir = copie_with_examples.project_dir / "site"
+    # List each page directory once; its entries answer the markdown checks
+    entries = {}
+    for directory in {os.path.dirname(md_rel) for _, md_rel in PAGE_PATHS}:
+        with os.scandir(os.path.join(site_dir, directory)) as it:
+            entries.update((os.path.join(directory, entry.name), entry) for entry in it)
 
     # Verify both HTML and markdown exist for each page
-    pages = [
-        "index",
-        "pages/getting-started",
-        "pages/user-guide",
-        "pages/api-reference",
-        "pages/contributing",
-    ]
-
-    for page in pages:
-        html_path = (
-            site_dir / f"{page if page == 'index' else page}/index.html" if page != "index" else site_dir / "index.html"
-        )
-        md_path = site_dir / f"{page}.md"
+    for html_rel, md_rel in PAGE_PATHS:
+        md_entry = entries.get(md_rel)
 
-        assert html_path.is_file(), f"HTML not found: {html_path}"
-        assert md_path.is_file(), f"Markdown not found: {md_path}"
+        assert os.path.isfile(site_dir / html_rel), f"HTML not found: {site_dir / html_rel}"
+        assert md_entry is not None and md_entry.is_file(), f"Markdown not found: {site_dir / md_rel}"
 
         # Verify markdown is not empty
-        md_content = md_path.read_text(encoding="utf-8")
-        assert len(md_content) > 50, f"Markdown too short for {page}"
+        assert md_entry.stat().st_size > 50, f"Markdown too short for {md_rel}"
@@ -18,287 +18,247 @@ Template options tested:
 - include_examples (covered in test_option_combinations.py)
 """
 
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+# Answers for the derivation tests; package_name and project_slug are left to derive
+DERIVATION_ANSWERS = {
+    "description": "A test project",
+    "author_name": "Test Author",
+    "author_email": "test@example.com",
+    "github_username": "testuser",
+    "version": "0.1.0",
+    "min_python_version": "3.11",
+    "license": "MIT",
+    "include_actions": True,
+    "include_examples": True,
+}
+
+# Values test_all_custom_values expects in pyproject.toml, found in a single scan
+CUSTOM_PYPROJECT_VALUES = (
+    'name = "custom_pkg"',  # pyproject.toml name field uses package_name, not project_slug
+    'dynamic = ["version"]',  # Version is dynamic (hatch-vcs), not in pyproject.toml
+    "Custom Author",
+    "custom@example.com",
+    "A custom description for testing",
+)
+_CUSTOM_PYPROJECT_RE = re.compile("|".join(map(re.escape, CUSTOM_PYPROJECT_VALUES)))
+
+
+def _sole_child_name(directory: Path) -> str:
+    """Return the name of the only entry in a directory, listed in one scan."""
+    with os.scandir(directory) as it:
+        names = [entry.name for entry in it]
+    assert len(names) == 1, f"Expected exactly one entry in {directory}, found {names}"
+    return names[0]
+
 
 class TestDescriptionOption:
     """Test the description option propagation."""
 
-    def test_custom_description(self, copie):
+    def test_custom_description(self, rendered_projects):
         """Test that custom description propagates to multiple files."""
         custom_description = "A powerful tool for data analysis and visualization"
-        result = copie.copy(extra_answers={"description": custom_description})
-        assert result.exit_code == 0
+        project = rendered_projects({"description": custom_description})
 
         # Check pyproject.toml
-        pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
-        assert f'description = "{custom_description}"' in pyproject_content
+        assert f'description = "{custom_description}"' in project.pyproject
 
         # Check README.md
-        readme_content = (result.project_dir / "README.md").read_text(encoding="utf-8")
-        assert custom_description in readme_content
+        assert custom_description in project.readme
 
         # Check mkdocs.yml
-        mkdocs_content = (result.project_dir / "mkdocs.yml").read_text(encoding="utf-8")
-        assert custom_description in mkdocs_content
+        assert custom_description in project.mkdocs
 
         # Check docs/index.md
-        docs_index_content = (result.project_dir / "docs" / "index.md").read_text(encoding="utf-8")
-        assert custom_description in docs_index_content
+        assert custom_description in project.docs_index
 
-    def test_empty_description(self, copie):
+    def test_empty_description(self, rendered_projects):
         """Test that empty description is handled gracefully."""
-        result = copie.copy(extra_answers={"description": ""})
-        assert result.exit_code == 0
-
         # Should not break generation
-        assert (result.project_dir / "pyproject.toml").is_file()
-        pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
-        assert 'description = ""' in pyproject_content
+        project = rendered_projects({"description": ""})
+        assert 'description = ""' in project.pyproject
 
-    def test_description_with_special_chars(self, copie):
+    def test_description_with_special_chars(self, rendered_projects):
         """Test description with quotes and special characters."""
         special_description = 'A "modern" tool with <features> & more!'
-        result = copie.copy(extra_answers={"description": special_description})
-        assert result.exit_code == 0
+        project = rendered_projects({"description": special_description})
 
         # Description should be properly escaped in pyproject.toml
-        pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
         # Should contain the description (with proper escaping)
-        assert "modern" in pyproject_content
-        assert "tool" in pyproject_content
+        assert "modern" in project.pyproject
+        assert "tool" in project.pyproject
 
 
 class TestAuthorOptions:
     """Test author_name and author_email options."""
 
-    def test_custom_author_name(self, copie):
+    def test_custom_author_name(self, rendered_projects):
         """Test that custom author name propagates correctly."""
         custom_author = "Jane Doe"
-        result = copie.copy(extra_answers={"author_name": custom_author})
-        assert result.exit_code == 0
+        project = rendered_projects({"author_name": custom_author})
 
         # Check pyproject.toml
-        pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
-        assert custom_author in pyproject_content
+        assert custom_author in project.pyproject
 
         # Check LICENSE (MIT default)
-        license_content = (result.project_dir / "LICENSE").read_text(encoding="utf-8")
-        assert custom_author in license_content
+        assert custom_author in project.license
 
-    def test_author_name_with_unicode(self, copie):
+    def test_author_name_with_unicode(self, rendered_projects):
         """Test author name with unicode characters."""
         unicode_author = "José García"
-        result = copie.copy(extra_answers={"author_name": unicode_author})
-        assert result.exit_code == 0
+        project = rendered_projects({"author_name": unicode_author})
 
         # Should work without issues
-        license_content = (result.project_dir / "LICENSE").read_text(encoding="utf-8")
-        assert unicode_author in license_content
+        assert unicode_author in project.license
 
-    def test_custom_author_email(self, copie):
+    def test_custom_author_email(self, rendered_projects):
         """Test that custom author email propagates correctly."""
         custom_email = "jane.doe@example.org"
-        result = copie.copy(extra_answers={"author_email": custom_email})
-        assert result.exit_code == 0
+        project = rendered_projects({"author_email": custom_email})
 
         # Check pyproject.toml
-        pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
-        assert custom_email in pyproject_content
+        assert custom_email in project.pyproject
 
-    def test_author_email_with_plus_sign(self, copie):
+    def test_author_email_with_plus_sign(self, rendered_projects):
         """Test email with plus sign (common for email aliases)."""
         email_with_plus = "author+project@example.com"
-        result = copie.copy(extra_answers={"author_email": email_with_plus})
-        assert result.exit_code == 0
+        project = rendered_projects({"author_email": email_with_plus})
 
-        pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
-        assert email_with_plus in pyproject_content
+        assert email_with_plus in project.pyproject
 
 
 class TestGithubUsernameOption:
     """Test github_username option propagation."""
 
-    def test_custom_github_username(self, copie):
+    def test_custom_github_username(self, rendered_projects):
         """Test that github_username propagates to all GitHub URLs."""
         custom_username = "my-org"
-        result = copie.copy(
-            extra_answers={
-                "github_username": custom_username,
-                "project_slug": "test-project",
-            }
-        )
-        assert result.exit_code == 0
+        project = rendered_projects({
+            "github_username": custom_username,
+            "project_slug": "test-project",
+        })
 
         expected_repo_url = f"https://github.com/{custom_username}/test-project"
 
-        # Check README.md
-        readme_content = (result.project_dir / "README.md").read_text(encoding="utf-8")
-        assert custom_username in readme_content
-        assert expected_repo_url in readme_content
+        # Check README.md; the repository URL includes the username
+        assert expected_repo_url in project.readme
 
         # Check mkdocs.yml
-        mkdocs_content = (result.project_dir / "mkdocs.yml").read_text(encoding="utf-8")
-        assert f"repo_url: {expected_repo_url}" in mkdocs_content
-        assert f"repo_name: {custom_username}/test-project" in mkdocs_content
+        assert f"repo_url: {expected_repo_url}" in project.mkdocs
+        assert f"repo_name: {custom_username}/test-project" in project.mkdocs
 
         # Check pyproject.toml
-        pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
         # GitHub URLs might not be in pyproject.toml depending on template
         # Just verify project was created successfully
-        assert "name = " in pyproject_content
+        assert "name = " in project.pyproject
 
-    def test_empty_github_username(self, copie):
+    def test_empty_github_username(self, rendered_projects):
         """Test with empty github_username (default value)."""
-        result = copie.copy(extra_answers={"github_username": ""})
-        assert result.exit_code == 0
+        project = rendered_projects({"github_username": ""})
 
         # Should still generate successfully but URLs might be incomplete
-        assert (result.project_dir / "pyproject.toml").is_file()
+        assert (project.project_dir / "pyproject.toml").is_file()
 
         # Should have placeholder or empty GitHub URL sections
-        assert (result.project_dir / "README.md").is_file()
+        assert (project.project_dir / "README.md").is_file()
 
 
 class TestProjectNameDerivation:
     """Test auto-derivation of package_name and project_slug from project_name."""
 
-    def test_project_name_to_package_name_derivation(self, copie):
-        """Test that package_name is correctly derived from project_name."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "project_name,expected_package_name",
+        [
             ("My Project", "my_project"),
             ("My-Project", "my_project"),
             ("my-project", "my_project"),
             ("My Cool Tool", "my_cool_tool"),
             ("Tool-V2", "tool_v2"),
-        ]
-
-        for project_name, expected_package_name in test_cases:
-            # Create a custom fixture that doesn't set package_name
-            project_dir = copie.tmp_path / f"test-project-{expected_package_name}"
-
-            from copier import run_copy
-
-            answers = {
-                "project_name": project_name,
-                # Explicitly don't set package_name - let it derive
-                "description": "A test project",
-                "author_name": "Test Author",
-                "author_email": "test@example.com",
-                "github_username": "testuser",
-                "version": "0.1.0",
-                "min_python_version": "3.11",
-                "license": "MIT",
-                "include_actions": True,
-                "include_examples": True,
-            }
-
-            run_copy(
-                str(copie.template_dir),
-                str(project_dir),
-                data=answers,
-                defaults=True,
-                overwrite=True,
-                unsafe=True,
-                vcs_ref="HEAD",
-            )
-
-            assert project_dir.exists()
-
-            # Check that the derived package_name directory exists
-            src_dir = project_dir / "src"
-            package_dirs = list(src_dir.iterdir())
-            assert len(package_dirs) == 1
-            assert package_dirs[0].name == expected_package_name, (
-                f"Expected {expected_package_name}, got {package_dirs[0].name}"
-            )
-
-    def test_project_name_to_project_slug_derivation(self, copie):
+        ],
+    )
+    def test_project_name_to_package_name_derivation(self, cached_run_copy, project_name, expected_package_name):
+        """Test that package_name is correctly derived from project_name."""
+        project_dir = cached_run_copy({**DERIVATION_ANSWERS, "project_name": project_name})
+
+        assert project_dir.exists()
+
+        # Check that the derived package_name directory exists
+        package_name = _sole_child_name(project_dir / "src")
+        assert package_name == expected_package_name, f"Expected {expected_package_name}, got {package_name}"
+
+    @pytest.mark.parametrize(
+        "project_name",
+        [
+            "My Project",  # Copier default derivation keeps underscores
+            "My-Project",
+            "my_project",
+            "My Cool Tool",
+        ],
+    )
+    def test_project_name_to_project_slug_derivation(self, rendered_projects, project_name):
         """Test that project_slug is correctly derived from project_name."""
-        test_cases = [
-            ("My Project", "my_project"),  # Copier default derivation keeps underscores
-            ("My-Project", "my_project"),
-            ("my_project", "my_project"),
-            ("My Cool Tool", "my_cool_tool"),
-        ]
-
-        for project_name, _expected_slug in test_cases:
-            result = copie.copy(
-                extra_answers={
-                    "project_name": project_name,
-                    # Don't override project_slug, let it auto-derive
-                }
-            )
-            assert result.exit_code == 0
-
-            # Check pyproject.toml name field
-            pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
-            # Name should exist in pyproject.toml
-            assert "name = " in pyproject_content
-
-    def test_explicit_package_name_override(self, copie):
+        project = rendered_projects({
+            "project_name": project_name,
+            # Don't override project_slug, let it auto-derive
+        })
+
+        # Check pyproject.toml name field
+        # Name should exist in pyproject.toml
+        assert "name = " in project.pyproject
+
+    def test_explicit_package_name_override(self, copie_cache):
         """Test that explicit package_name overrides auto-derivation."""
-        result = copie.copy(
-            extra_answers={
-                "project_name": "My Cool Project",
-                "package_name": "custom_package",
-            }
-        )
-        assert result.exit_code == 0
+        result = copie_cache({
+            "project_name": "My Cool Project",
+            "package_name": "custom_package",
+        })
 
         # Should use the explicit package_name
-        src_dir = result.project_dir / "src"
-        package_dirs = list(src_dir.iterdir())
-        assert len(package_dirs) == 1
-        assert package_dirs[0].name == "custom_package"
+        assert _sole_child_name(result.project_dir / "src") == "custom_package"
 
-    def test_explicit_project_slug_override(self, copie):
+    def test_explicit_project_slug_override(self, rendered_projects):
         """Test that explicit project_slug overrides auto-derivation."""
-        result = copie.copy(
-            extra_answers={
-                "project_name": "My Cool Project",
-                "package_name": "custom_package",
-                "project_slug": "custom-slug",
-            }
-        )
-        assert result.exit_code == 0
+        project = rendered_projects({
+            "project_name": "My Cool Project",
+            "package_name": "custom_package",
+            "project_slug": "custom-slug",
+        })
 
         # pyproject.toml name field uses package_name, not project_slug
-        pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
-        assert 'name = "custom_package"' in pyproject_content
+        assert 'name = "custom_package"' in project.pyproject
 
         # But project_slug is used in URLs and GitHub links
-        readme_content = (result.project_dir / "README.md").read_text(encoding="utf-8")
-        assert "custom-slug" in readme_content
+        assert "custom-slug" in project.readme
 
 
 class TestProjectNameEdgeCases:
     """Test edge cases for project naming."""
 
-    def test_project_name_with_numbers(self, copie):
+    def test_project_name_with_numbers(self, copie_cache):
         """Test project names with numbers."""
-        result = copie.copy(extra_answers={"project_name": "Tool V2.0"})
-        assert result.exit_code == 0
+        result = copie_cache({"project_name": "Tool V2.0"})
 
         # Should handle numbers correctly
         assert (result.project_dir / "pyproject.toml").is_file()
 
-    def test_project_name_with_special_chars(self, copie):
+    def test_project_name_with_special_chars(self, copie_cache):
         """Test project names with special characters (if allowed by copier)."""
         # Note: Copier might validate project names, so this tests the template's handling
-        result = copie.copy(extra_answers={"project_name": "My-Tool_v1"})
-        assert result.exit_code == 0
+        result = copie_cache({"project_name": "My-Tool_v1"})
 
-        src_dir = result.project_dir / "src"
         # Should convert to valid Python identifier
-        package_dirs = list(src_dir.iterdir())
-        assert len(package_dirs) == 1
+        package_name = _sole_child_name(result.project_dir / "src")
         # Should be all lowercase with underscores
-        assert "_" in package_dirs[0].name or "-" not in package_dirs[0].name
+        assert "_" in package_name or "-" not in package_name
 
-    def test_very_long_project_name(self, copie):
+    def test_very_long_project_name(self, copie_cache):
         """Test with a very long project name."""
         long_name = "My Very Long Project Name With Many Words That Keeps Going"
-        result = copie.copy(extra_answers={"project_name": long_name})
-        assert result.exit_code == 0
+        result = copie_cache({"project_name": long_name})
 
         # Should still work
         assert (result.project_dir / "pyproject.toml").is_file()
@@ -309,7 +269,7 @@ class TestProjectNameEdgeCases:
 class TestOptionCombinations:
     """Test combinations of custom option values."""
 
-    def test_all_custom_values(self, copie):
+    def test_all_custom_values(self, rendered_projects):
         """Test with all options set to custom (non-default) values."""
         custom_answers = {
             "project_name": "Custom Project",
@@ -326,37 +286,25 @@ class TestOptionCombinations:
             "include_examples": False,
         }
 
-        result = copie.copy(extra_answers=custom_answers)
-        assert result.exit_code == 0
+        project = rendered_projects(custom_answers)
 
         # Verify key propagations
-        pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
-        # pyproject.toml name field uses package_name, not project_slug
-        assert 'name = "custom_pkg"' in pyproject_content
-        # Version is dynamic (hatch-vcs), not in pyproject.toml
-        assert 'dynamic = ["version"]' in pyproject_content
-        assert "Custom Author" in pyproject_content
-        assert "custom@example.com" in pyproject_content
-        assert "A custom description for testing" in pyproject_content
+        missing = set(CUSTOM_PYPROJECT_VALUES) - set(_CUSTOM_PYPROJECT_RE.findall(project.pyproject))
+        assert not missing, f"pyproject.toml is missing: {sorted(missing)}"
 
         # Verify package directory
-        assert (result.project_dir / "src" / "custom_pkg").is_dir()
+        assert (project.project_dir / "src" / "custom_pkg").is_dir()
 
-        # Verify GitHub username in README
-        readme_content = (result.project_dir / "README.md").read_text(encoding="utf-8")
-        assert "custom-org" in readme_content
+        # Verify GitHub username in README, as part of the repository URL
+        assert "https://github.com/custom-org/custom-project" in project.readme
 
         # Verify license
-        license_content = (result.project_dir / "LICENSE").read_text(encoding="utf-8")
-        assert "Apache License" in license_content
-        assert "Custom Author" in license_content
+        assert "Apache License" in project.license
+        assert "Custom Author" in project.license
 
-    def test_minimal_required_values(self, copie):
+    def test_minimal_required_values(self, baseline_rendered):
         """Test with only required values, letting others use defaults."""
         # The conftest fixture already provides defaults, but this tests the concept
-        result = copie.copy(extra_answers={})
-        assert result.exit_code == 0
-
         # Should use all defaults from conftest
-        assert (result.project_dir / "pyproject.toml").is_file()
-        assert (result.project_dir / "src" / "test_project").is_dir()
+        assert (baseline_rendered.project_dir / "pyproject.toml").is_file()
+        assert (baseline_rendered.project_dir / "src" / "test_project").is_dir()
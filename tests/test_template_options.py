@@ -1,31 +1,74 @@
 """Tests for template option combinations and integration scenarios."""
 
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import pytest
 
+# Recipes every generated justfile must define
+JUSTFILE_COMMANDS = (
+    "default:",
+    "test:",
+    "test-fast:",
+    "test-slow:",
+    "test-cov:",
+    "test-docstrings:",
+    "fix:",  # single command for format, lint, and type check
+    "build:",
+    "serve:",
+    "clean:",
+    "all:",
+)
+_JUSTFILE_COMMANDS_RE = re.compile("|".join(map(re.escape, sorted(JUSTFILE_COMMANDS, key=len, reverse=True))))
 
-@pytest.mark.parametrize(
-    "include_examples,include_actions",
-    [
-        (True, True),
-        (True, False),
-        (False, True),
-        (False, False),
-    ],
+
+def _contains(path: Path, needle: str) -> bool:
+    """Return whether a needle occurs in a file, searching its raw bytes without decoding them."""
+    return needle.encode() in path.read_bytes()
+
+
+def _head(path: Path, size: int = 4096) -> str:
+    """Return the start of a file, for checks that only concern its header."""
+    with path.open("rb") as file:
+        return file.read(size).decode("utf-8", errors="ignore")
+
+
+def _run_logged(cmd: list[str], cwd: Path, log_path: Path, timeout: int, env: dict[str, str] | None = None) -> int:
+    """Run a command with its combined output streamed to a log file and return its exit code.
+
+    Docs builds print a lot; the log is only read back when the command fails.
+    """
+    with log_path.open("wb") as log:
+        return subprocess.run(
+            cmd, cwd=cwd, env=env, stdout=log, stderr=subprocess.STDOUT, timeout=timeout, check=False
+        ).returncode
+
+
+@pytest.fixture(
+    scope="module",
+    params=[(True, True), (True, False), (False, True), (False, False)],
+    ids=lambda param: f"examples={param[0]}-actions={param[1]}",
 )
-def test_option_combinations(copie, include_examples, include_actions):
-    """Test all combinations of include_examples and include_actions."""
-    result = copie.copy(
-        extra_answers={
+def rendered(request, copie_cache):
+    """One shared read-only render per ``(include_examples, include_actions)`` combination.
+
+    Returns the two options together with the render, so each check knows what to expect.
+    """
+    include_examples, include_actions = request.param
+    result = copie_cache(
+        {
             "include_examples": include_examples,
             "include_actions": include_actions,
         },
     )
+    return include_examples, include_actions, result
 
-    assert result.exit_code == 0
 
-    # Test examples-related files
+def test_combination_examples_dir(rendered):
+    """Test that examples/ follows include_examples in every combination."""
+    include_examples, _, result = rendered
     examples_dir = result.project_dir / "examples"
     if include_examples:
         assert examples_dir.is_dir(), "examples/ should exist when include_examples=True"
@@ -33,7 +76,10 @@ def test_option_combinations(copie, include_examples, include_actions):
     else:
         assert not examples_dir.exists(), "examples/ should not exist when include_examples=False"
 
-    # Test GitHub Actions workflows
+
+def test_combination_workflows_dir(rendered):
+    """Test that .github/workflows/ follows include_actions in every combination."""
+    _, include_actions, result = rendered
     workflows_dir = result.project_dir / ".github" / "workflows"
     if include_actions:
         assert workflows_dir.is_dir(), ".github/workflows/ should exist when include_actions=True"
@@ -41,37 +87,37 @@ def test_option_combinations(copie, include_examples, include_actions):
     else:
         assert not workflows_dir.exists(), ".github/workflows/ should not exist when include_actions=False"
 
-    # Test hooks.py content
-    hooks_file = result.project_dir / "docs" / "hooks.py"
-    assert hooks_file.is_file(), "docs/hooks.py should always exist"
-    hooks_content = hooks_file.read_text(encoding="utf-8")
 
+def _assert_examples_markers(path: Path, markers: tuple[str, ...], include_examples: bool) -> None:
+    """Assert that the examples markers are all present in a file, or all absent."""
+    data = path.read_bytes()
+    found = {marker for marker in markers if marker.encode() in data}
     if include_examples:
-        assert "on_pre_build" in hooks_content, "on_pre_build should exist when include_examples=True"
-        assert "marimo" in hooks_content, "marimo logic should exist when include_examples=True"
+        assert found == set(markers), (
+            f"{path.name} is missing {sorted(set(markers) - found)} with include_examples=True"
+        )
     else:
-        assert "on_pre_build" not in hooks_content, "on_pre_build should not exist when include_examples=False"
-        assert "marimo" not in hooks_content, "marimo logic should not exist when include_examples=False"
+        assert not found, f"{path.name} should not contain {sorted(found)} with include_examples=False"
 
-    # Test pyproject.toml dependencies
-    pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
-    if include_examples:
-        assert "marimo" in pyproject_content, "marimo should be in dependencies when include_examples=True"
-        assert "plotly" in pyproject_content, "plotly should be in dependencies when include_examples=True"
-    else:
-        assert "marimo" not in pyproject_content, "marimo should not be in dependencies when include_examples=False"
-        assert "plotly" not in pyproject_content, "plotly should not be in dependencies when include_examples=False"
 
-    # Test noxfile sessions
-    noxfile_content = (result.project_dir / "noxfile.py").read_text(encoding="utf-8")
-    if include_examples:
-        assert "def test_examples(session:" in noxfile_content, (
-            "test_examples session should exist when include_examples=True"
-        )
-    else:
-        assert "def test_examples(session:" not in noxfile_content, (
-            "test_examples session should not exist when include_examples=False"
-        )
+def test_combination_hooks_content(rendered):
+    """Test that docs/hooks.py always exists and only exports notebooks with examples."""
+    include_examples, _, result = rendered
+    hooks_file = result.project_dir / "docs" / "hooks.py"
+    assert hooks_file.is_file(), "docs/hooks.py should always exist"
+    _assert_examples_markers(hooks_file, ("on_pre_build", "marimo"), include_examples)
+
+
+def test_combination_pyproject_deps(rendered):
+    """Test that the examples dependencies follow include_examples in every combination."""
+    include_examples, _, result = rendered
+    _assert_examples_markers(result.project_dir / "pyproject.toml", ("marimo", "plotly"), include_examples)
+
+
+def test_combination_noxfile_session(rendered):
+    """Test that the test_examples nox session follows include_examples in every combination."""
+    include_examples, _, result = rendered
+    _assert_examples_markers(result.project_dir / "noxfile.py", ("def test_examples(session:",), include_examples)
 
 
 @pytest.mark.parametrize(
@@ -89,9 +135,9 @@ def test_all_licenses(copie, license_type):
     assert result.exit_code == 0
 
     license_file = result.project_dir / "LICENSE"
-    assert license_file.is_file(), f"LICENSE file should exist for {license_type}"
 
-    license_content = license_file.read_text(encoding="utf-8")
+    # Every license identifies itself in its first lines; a missing file fails the read
+    license_content = _head(license_file, 2048)
 
     # Verify license-specific content
     if license_type == "Apache-2.0":
@@ -109,8 +155,7 @@ def test_all_licenses(copie, license_type):
         assert "Proprietary License" in license_content or "All Rights Reserved" in license_content
 
     # Verify pyproject.toml has correct license (uses table format)
-    pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
-    assert f'license = {{ text = "{license_type}" }}' in pyproject_content
+    assert _contains(result.project_dir / "pyproject.toml", f'license = {{ text = "{license_type}" }}')
 
 
 @pytest.mark.parametrize(
@@ -128,8 +173,7 @@ def test_all_python_versions(copie, python_version):
     assert result.exit_code == 0
 
     # Check pyproject.toml
-    pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
-    assert f'requires-python = ">={python_version}"' in pyproject_content
+    assert _contains(result.project_dir / "pyproject.toml", f'requires-python = ">={python_version}"')
 
     # Check noxfile.py Python version matrix
     noxfile_content = (result.project_dir / "noxfile.py").read_text(encoding="utf-8")
@@ -141,60 +185,58 @@ def test_all_python_versions(copie, python_version):
         assert f'"{version}"' in noxfile_content, f"Python {version} should be in noxfile"
 
 
-@pytest.mark.integration
-def test_examples_disabled_docs_build_works(copie):
-    """Test that docs can be built when examples are disabled."""
-    result = copie.copy(
-        extra_answers={
-            "include_examples": False,
-        },
-    )
+@pytest.fixture(scope="module")
+def parallel_builds(copie_module, uv_cache_env):
+    """Build the docs of an examples-disabled and an examples-enabled project concurrently.
+
+    Both builds are independent subprocesses, so running them side by side halves
+    the wall-clock time of the two integration tests. The projects are rendered
+    first, one after the other, since copier is not thread-safe. Returns each
+    project with its build's exit code and log, keyed by ``include_examples``.
+    Both builds share the session's uv cache, so they resolve and download the
+    docs dependencies only once.
+    """
+    builds = {}
+    for include_examples, timeout in ((False, 120), (True, 180)):
+        name = f"examples-{str(include_examples).lower()}"
+        result = copie_module.copy(extra_answers={"include_examples": include_examples}, dirname=name)
+        assert result.exit_code == 0
+        builds[include_examples] = (result, copie_module.tmp_path / f"{name}.log", timeout)
+
+    with ThreadPoolExecutor(max_workers=len(builds)) as pool:
+        futures = {
+            include_examples: pool.submit(
+                _run_logged, ["uvx", "nox", "-s", "build_docs"], result.project_dir, log_path, timeout, uv_cache_env
+            )
+            for include_examples, (result, log_path, timeout) in builds.items()
+        }
+        return {
+            include_examples: (builds[include_examples][0], future.result(), builds[include_examples][1])
+            for include_examples, future in futures.items()
+        }
 
-    assert result.exit_code == 0
 
-    # Attempt to build docs
-    docs_result = subprocess.run(
-        ["uvx", "nox", "-s", "build_docs"],
-        cwd=result.project_dir,
-        capture_output=True,
-        text=True,
-        timeout=120,
-        check=False,
-    )
+@pytest.mark.integration
+def test_examples_disabled_docs_build_works(parallel_builds):
+    """Test that docs can be built when examples are disabled."""
+    _, returncode, log_path = parallel_builds[False]
 
-    assert docs_result.returncode == 0, (
-        f"Docs build failed with include_examples=False:\nSTDOUT:\n{docs_result.stdout}\nSTDERR:\n{docs_result.stderr}"
-    )
+    if returncode != 0:
+        pytest.fail(f"Docs build failed with include_examples=False:\n{log_path.read_text(errors='replace')}")
 
 
 @pytest.mark.integration
-def test_examples_enabled_full_integration(copie):
+def test_examples_enabled_full_integration(parallel_builds):
     """Test complete workflow when examples are enabled."""
-    result = copie.copy(
-        extra_answers={
-            "include_examples": True,
-        },
-    )
-
-    assert result.exit_code == 0
+    result, returncode, log_path = parallel_builds[True]
 
     # Test that example notebook exists
     examples_dir = result.project_dir / "examples"
     assert (examples_dir / "hello.py").is_file()
 
     # Test that docs can be built with examples
-    docs_result = subprocess.run(
-        ["uvx", "nox", "-s", "build_docs"],
-        cwd=result.project_dir,
-        capture_output=True,
-        text=True,
-        timeout=180,
-        check=False,
-    )
-
-    assert docs_result.returncode == 0, (
-        f"Docs build failed with include_examples=True:\nSTDOUT:\n{docs_result.stdout}\nSTDERR:\n{docs_result.stderr}"
-    )
+    if returncode != 0:
+        pytest.fail(f"Docs build failed with include_examples=True:\n{log_path.read_text(errors='replace')}")
 
 
 def test_readthedocs_config_consistency(copie):
@@ -203,8 +245,6 @@ def test_readthedocs_config_consistency(copie):
     assert result.exit_code == 0
 
     rtd_config = result.project_dir / ".readthedocs.yml"
-    assert rtd_config.is_file()
-
     content = rtd_config.read_text(encoding="utf-8")
 
     # Should specify Python version
@@ -224,27 +264,11 @@ def test_justfile_commands_comprehensive(copie):
     assert result.exit_code == 0
 
     justfile = result.project_dir / "justfile"
-    assert justfile.is_file()
-
     content = justfile.read_text(encoding="utf-8")
 
-    # Essential commands
-    expected_commands = [
-        "default:",
-        "test:",
-        "test-fast:",
-        "test-slow:",
-        "test-cov:",
-        "test-docstrings:",
-        "fix:",  # single command for format, lint, and type check
-        "build:",
-        "serve:",
-        "clean:",
-        "all:",
-    ]
-
-    for cmd in expected_commands:
-        assert cmd in content, f"Command '{cmd}' should be in justfile"
+    # Essential commands, found in a single scan
+    missing = set(JUSTFILE_COMMANDS) - set(_JUSTFILE_COMMANDS_RE.findall(content))
+    assert not missing, f"Commands {sorted(missing)} should be in justfile"
 
 
 def test_changelog_initial_content(copie):
@@ -255,9 +279,7 @@ def test_changelog_initial_content(copie):
     assert result.exit_code == 0
 
     changelog = result.project_dir / "CHANGELOG.md"
-    assert changelog.is_file()
-
-    content = changelog.read_text(encoding="utf-8")
+    content = _head(changelog)
 
     # Should have changelog header
     assert "# Changelog" in content or "# CHANGELOG" in content
@@ -272,8 +294,6 @@ def test_git_cliff_config_content(copie):
     assert result.exit_code == 0
 
     git_cliff_config = result.project_dir / ".git-cliff.toml"
-    assert git_cliff_config.is_file()
-
     content = git_cliff_config.read_text(encoding="utf-8")
 
     # Should have conventional commits configuration